@@ -3,23 +3,445 @@ Entelech Sales Process Automation Dashboard
 Interactive web interface for managing the end-to-end sales workflow
 """
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash
+from flask import Flask, render_template, request, redirect, url_for, flash
 import json
+import hashlib
+import orjson
 import sqlite3
-from datetime import datetime, timedelta, date
+import threading
+import atexit
+import logging
+import time
+import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, date, timezone
 import sys
 import os
-from typing import Dict, List, Any
+from urllib.request import pathname2url
+from typing import Dict, Any
+from werkzeug.exceptions import HTTPException
 
-# Add src directory to path for imports
+# Add src directory to path for the (lazily imported) engine module
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
-from sales_automation_engine import SalesProcessAutomationEngine, DiscoveryCallData, QualificationStatus
+
+logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'entelech-sales-automation-2025'
 
-# Initialize sales automation engine
-sales_engine = SalesProcessAutomationEngine("../database/sales_automation.db")
+DB_PATH = "../database/sales_automation.db"
+
+def ojson(obj, status: int = 200):
+    """JSON response serialized with orjson"""
+    return app.response_class(
+        orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC),
+        status=status,
+        mimetype='application/json'
+    )
+
+# Dollar amounts in the overview key metrics, e.g. "$12,500.00"
+format_currency = "${:,.2f}".format
+
+def conditional_ojson(obj):
+    """JSON response with a content-hash ETag; 304 when the client's copy is current"""
+    response = ojson(obj)
+    response.set_etag(hashlib.blake2s(response.get_data()).hexdigest()[:16])
+    return response.make_conditional(request)
+
+_engine_instance = None
+_engine_lock = threading.Lock()
+
+def _engine():
+    """Sales automation engine, imported and connected on first use so page
+    routes and worker start-up don't pay for it; built under a lock so
+    concurrent first calls share one engine and its connection pool"""
+    global _engine_instance
+    if _engine_instance is None:
+        with _engine_lock:
+            if _engine_instance is None:
+                from sales_automation_engine import SalesProcessAutomationEngine
+                _engine_instance = SalesProcessAutomationEngine(DB_PATH)
+    return _engine_instance
+
+# ================================
+# DATABASE CONNECTIONS
+# ================================
+
+# Persistent connections per worker thread, opened lazily on first use: a
+# writer for POST endpoints and a read-only connection for GET endpoints.
+# The thread-local holds the only strong reference, so a connection is closed
+# when its thread exits (the dev server starts a thread per request)
+_tls = threading.local()
+
+class _ThreadConnection(sqlite3.Connection):
+    """sqlite3 connection that supports weak references"""
+
+_open_connections: "weakref.WeakSet[_ThreadConnection]" = weakref.WeakSet()
+_open_connections_lock = threading.Lock()
+
+def _thread_conn(attr: str, read_only: bool) -> sqlite3.Connection:
+    """Get or open the calling thread's connection stored under attr"""
+    conn = getattr(_tls, attr, None)
+    if conn is None:
+        if read_only:
+            uri = f"file:{pathname2url(os.path.abspath(DB_PATH))}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False, isolation_level=None,
+                                   cached_statements=256, factory=_ThreadConnection)
+            conn.execute("PRAGMA query_only=1")
+        else:
+            conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None,
+                                   cached_statements=256, factory=_ThreadConnection)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript("""
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+            PRAGMA mmap_size=268435456;
+        """)
+        conn.row_factory = sqlite3.Row
+        setattr(_tls, attr, conn)
+        with _open_connections_lock:
+            _open_connections.add(conn)
+    return conn
+
+def get_conn() -> sqlite3.Connection:
+    """Get the calling thread's persistent read-write database connection"""
+    return _thread_conn('conn', read_only=False)
+
+def get_ro_conn() -> sqlite3.Connection:
+    """Get the calling thread's persistent read-only connection; with WAL its
+    reads never wait on the writer lock"""
+    return _thread_conn('ro_conn', read_only=True)
+
+def ensure_dashboard_indexes():
+    """Create indexes and tables the dashboard relies on if the database predates them"""
+    try:
+        get_conn().executescript("""
+            CREATE INDEX IF NOT EXISTS idx_discovery_status_date
+            ON discovery_calls(qualified_status, call_date DESC, call_id DESC);
+            CREATE INDEX IF NOT EXISTS idx_sow_generated ON generated_sows(generated_at);
+            CREATE INDEX IF NOT EXISTS idx_contract_executed ON generated_contracts(fully_executed_at);
+            CREATE INDEX IF NOT EXISTS idx_payment_transaction_config_status
+            ON payment_transactions(config_id, transaction_status, transaction_type);
+            CREATE INDEX IF NOT EXISTS idx_sow_discovery_status
+            ON generated_sows(discovery_call_id, sow_status, total_project_cost);
+            CREATE INDEX IF NOT EXISTS idx_contract_sow_status ON generated_contracts(sow_id, contract_status);
+            CREATE INDEX IF NOT EXISTS idx_workflow_log_start
+            ON workflow_automation_log(processing_start_time, process_type);
+            
+            CREATE TABLE IF NOT EXISTS background_tasks (
+                task_id TEXT PRIMARY KEY,
+                task_type TEXT NOT NULL,
+                source_record_id INTEGER NOT NULL,
+                task_status TEXT DEFAULT 'queued',
+                task_result TEXT,
+                error_message TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                completed_at TIMESTAMP
+            );
+        """)
+    except sqlite3.OperationalError as e:
+        print(f"Warning: Could not create dashboard indexes: {e}")
+
+def tuple_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """Cursor yielding plain tuples, to be zipped with a column-name tuple"""
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor
+
+@atexit.register
+def _close_connections():
+    """Close the connections of still-running threads on interpreter shutdown"""
+    with _open_connections_lock:
+        for conn in list(_open_connections):
+            conn.close()
+
+# Column names of the list queries, in SELECT order
+DISCOVERY_CALL_COLUMNS = (
+    "call_id", "company_name", "primary_contact_name", "industry", "company_size",
+    "overall_qualification_score", "qualified_status", "call_date", "sales_rep",
+    "budget_range", "timeline_urgency", "time_waste_hours_weekly",
+    "estimated_cost_inefficiency"
+)
+SOW_COLUMNS = (
+    "sow_id", "project_title", "total_project_cost", "timeline_weeks",
+    "sow_status", "generated_at", "sent_at", "approved_at",
+    "company_name", "primary_contact_name"
+)
+CONTRACT_COLUMNS = (
+    "contract_id", "contract_number", "contract_title",
+    "total_contract_value", "contract_status", "created_at",
+    "sent_for_signature_at", "fully_executed_at",
+    "client_legal_name", "client_signatory_name"
+)
+PROJECT_COLUMNS = (
+    "kickoff_id", "project_code", "project_name",
+    "project_manager", "kickoff_status", "created_at",
+    "kickoff_scheduled_date", "kickoff_completed_date",
+    "total_contract_value", "client_legal_name"
+)
+ACTIVITY_COLUMNS = ("type", "description", "timestamp")
+PENDING_ITEM_COLUMNS = (
+    "sows_pending_review", "contracts_pending_signature",
+    "projects_pending_kickoff", "overdue_payments"
+)
+TASK_COLUMNS = (
+    "task_id", "task_type", "source_record_id", "task_status",
+    "task_result", "error_message", "created_at", "completed_at"
+)
+
+# (field, cast, required, default) for building DiscoveryCallData from a submission
+DISCOVERY_CALL_FIELDS = (
+    ("company_name", None, True, None),
+    ("company_size", None, True, None),
+    ("industry", None, True, None),
+    ("annual_revenue", None, False, 'not_disclosed'),
+    ("primary_contact_name", None, True, None),
+    ("primary_contact_email", None, True, None),
+    ("primary_contact_title", None, True, None),
+    ("decision_maker_name", None, False, None),
+    ("decision_maker_title", None, False, None),
+    ("current_challenges", None, True, None),
+    ("manual_processes", None, True, None),
+    ("time_waste_hours_weekly", int, False, 0),
+    ("estimated_cost_inefficiency", float, False, 0.0),
+    ("current_tools_systems", None, False, ''),
+    ("team_size_affected", int, False, 0),
+    ("primary_objectives", None, True, None),
+    ("success_metrics", None, False, ''),
+    ("automation_priorities", None, False, ''),
+    ("integration_requirements", None, False, ''),
+    ("compliance_requirements", None, False, ''),
+    ("security_requirements", None, False, ''),
+    ("budget_range", None, False, 'not_disclosed'),
+    ("timeline_urgency", None, False, '3_months'),
+    ("decision_timeline", None, False, '1_month'),
+    ("roi_expectations", None, False, ''),
+    ("sales_rep", None, False, 'Unknown'),
+    ("call_duration_minutes", int, False, 60),
+    ("next_steps", None, False, ''),
+    ("call_notes", None, False, '')
+)
+
+def extract_fields(data: Dict[str, Any], fields) -> Dict[str, Any]:
+    """Pull declared fields out of a request payload, applying defaults and casts"""
+    values = {}
+    for name, cast, required, default in fields:
+        value = data[name] if required else data.get(name, default)
+        if cast is not None:
+            # Explicit nulls reach the cast too, so they fail as a bad request
+            value = cast(value)
+        values[name] = value
+    return values
+
+# ================================
+# SQL STATEMENTS
+# ================================
+
+# Built once at import so each connection's statement cache sees identical SQL text
+
+def _discovery_calls_sql(with_status: bool, with_cursor: bool) -> str:
+    """Discovery list query for one filter combination; literal predicates keep
+    idx_discovery_status_date usable"""
+    conditions = []
+    if with_status:
+        conditions.append("qualified_status = ?")
+    if with_cursor:
+        conditions.append("(call_date, call_id) < (?, ?)")
+    # Offset pages carry the filtered total on each row via a window count
+    return f"""
+        SELECT call_id, company_name, primary_contact_name, industry, company_size,
+               overall_qualification_score, qualified_status, call_date, sales_rep,
+               budget_range, timeline_urgency, time_waste_hours_weekly,
+               estimated_cost_inefficiency{"" if with_cursor else ", COUNT(*) OVER () as _total"}
+        FROM discovery_calls
+        WHERE {" AND ".join(conditions) or "1=1"}
+        ORDER BY call_date DESC, call_id DESC LIMIT ? OFFSET ?
+    """
+
+SQL_DISCOVERY_CALLS = {
+    (with_status, with_cursor): _discovery_calls_sql(with_status, with_cursor)
+    for with_status in (False, True)
+    for with_cursor in (False, True)
+}
+SQL_COUNT_DISCOVERY_CALLS = "SELECT COUNT(*) as total FROM discovery_calls"
+SQL_COUNT_DISCOVERY_CALLS_BY_STATUS = (
+    "SELECT COUNT(*) as total FROM discovery_calls WHERE qualified_status = ?"
+)
+
+SQL_GET_SOWS = """
+    SELECT s.sow_id, s.project_title, s.total_project_cost, s.timeline_weeks,
+           s.sow_status, s.generated_at, s.sent_at, s.approved_at,
+           d.company_name, d.primary_contact_name
+    FROM generated_sows s
+    JOIN discovery_calls d ON s.discovery_call_id = d.call_id
+    ORDER BY s.generated_at DESC
+    LIMIT 50
+"""
+
+# Approves a SOW and returns the SOW and discovery call fields that
+# generate_contract_from_sow reads, so it can skip its own SELECT
+SQL_APPROVE_SOW = """
+    UPDATE generated_sows
+    SET sow_status = 'approved', approved_at = CURRENT_TIMESTAMP
+    WHERE sow_id = ?
+    RETURNING sow_id, sow_status, project_title, project_description, deliverables,
+              timeline_weeks, total_project_cost, payment_schedule, payment_terms,
+              (SELECT company_name FROM discovery_calls WHERE call_id = discovery_call_id) AS company_name,
+              (SELECT primary_contact_name FROM discovery_calls WHERE call_id = discovery_call_id) AS primary_contact_name,
+              (SELECT primary_contact_title FROM discovery_calls WHERE call_id = discovery_call_id) AS primary_contact_title,
+              (SELECT primary_contact_email FROM discovery_calls WHERE call_id = discovery_call_id) AS primary_contact_email
+"""
+
+SQL_GET_CONTRACTS = """
+    SELECT c.contract_id, c.contract_number, c.contract_title,
+           c.total_contract_value, c.contract_status, c.created_at,
+           c.sent_for_signature_at, c.fully_executed_at,
+           c.client_legal_name, c.client_signatory_name
+    FROM generated_contracts c
+    ORDER BY c.created_at DESC
+    LIMIT 50
+"""
+
+SQL_GET_PROJECTS = """
+    SELECT pk.kickoff_id, pk.project_code, pk.project_name,
+           pk.project_manager, pk.kickoff_status, pk.created_at,
+           pk.kickoff_scheduled_date, pk.kickoff_completed_date,
+           c.total_contract_value, c.client_legal_name
+    FROM project_kickoffs pk
+    JOIN generated_contracts c ON pk.contract_id = c.contract_id
+    ORDER BY pk.created_at DESC
+    LIMIT 50
+"""
+
+SQL_GET_TASK = """
+    SELECT task_id, task_type, source_record_id, task_status,
+           task_result, error_message, created_at, completed_at
+    FROM background_tasks
+    WHERE task_id = ?
+"""
+
+RECENT_ACTIVITY_DAYS = 7
+SQL_RECENT_ACTIVITY = """
+    SELECT * FROM (
+        SELECT 'discovery_call' as type, company_name as description, call_date as timestamp
+        FROM discovery_calls
+        WHERE call_date >= :cutoff
+        ORDER BY call_date DESC
+        LIMIT 5
+    )
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'sow_generated' as type,
+               'SOW generated for ' || d.company_name as description,
+               s.generated_at as timestamp
+        FROM generated_sows s
+        JOIN discovery_calls d ON s.discovery_call_id = d.call_id
+        WHERE s.generated_at >= :cutoff
+        ORDER BY s.generated_at DESC
+        LIMIT 5
+    )
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'contract_executed' as type,
+               'Contract executed for ' || client_legal_name as description,
+               fully_executed_at as timestamp
+        FROM generated_contracts
+        WHERE fully_executed_at >= :cutoff
+        ORDER BY fully_executed_at DESC
+        LIMIT 5
+    )
+    ORDER BY timestamp DESC
+    LIMIT 10
+"""
+
+SQL_PENDING_ITEMS = """
+    SELECT
+        (SELECT COUNT(*) FROM generated_sows
+         WHERE sow_status = 'review') as sows_pending_review,
+        (SELECT COUNT(*) FROM generated_contracts
+         WHERE contract_status = 'sent_for_signature') as contracts_pending_signature,
+        (SELECT COUNT(*) FROM project_kickoffs
+         WHERE kickoff_status = 'pending') as projects_pending_kickoff,
+        (SELECT COUNT(*) FROM payment_transactions
+         WHERE transaction_status = 'pending' AND invoice_due_date < date('now')) as overdue_payments
+"""
+
+# ================================
+# OVERVIEW RESPONSE CACHE
+# ================================
+
+# Serialized overview responses keyed by (start_date, end_date); absorbs
+# dashboard auto-refresh polling between writes
+OVERVIEW_CACHE_TTL_SECONDS = 15
+OVERVIEW_CACHE_MAX_ENTRIES = 256
+_overview_cache: Dict[tuple, tuple] = {}
+_overview_cache_lock = threading.Lock()
+# Bumped by every invalidation; a result computed across a write is not cached
+_overview_cache_generation = 0
+
+def overview_cache_generation() -> int:
+    """Current invalidation generation, read before computing an overview"""
+    return _overview_cache_generation
+
+def get_cached_overview(key: tuple):
+    """Return the cached overview body for key, or None if missing or expired"""
+    with _overview_cache_lock:
+        entry = _overview_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, body = entry
+        if expires_at < time.monotonic():
+            del _overview_cache[key]
+            return None
+        return body
+
+def cache_overview(key: tuple, body: bytes, generation: int):
+    """Store a serialized overview body for key, unless the cache was
+    invalidated since generation was read"""
+    with _overview_cache_lock:
+        if generation != _overview_cache_generation:
+            return
+        now = time.monotonic()
+        if len(_overview_cache) >= OVERVIEW_CACHE_MAX_ENTRIES:
+            for stale_key in [k for k, (expires_at, _) in _overview_cache.items() if expires_at < now]:
+                del _overview_cache[stale_key]
+            if len(_overview_cache) >= OVERVIEW_CACHE_MAX_ENTRIES:
+                _overview_cache.clear()
+        _overview_cache[key] = (now + OVERVIEW_CACHE_TTL_SECONDS, body)
+
+def invalidate_overview_cache():
+    """Drop all cached overview responses after a write"""
+    global _overview_cache_generation
+    with _overview_cache_lock:
+        _overview_cache_generation += 1
+        _overview_cache.clear()
+
+# Fans out the independent overview queries; each worker thread reads
+# through its own get_ro_conn() connection
+_overview_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='overview')
+
+# Runs deferred write-side work (see background_tasks); SQLite serializes the
+# writers, so a few threads are enough to keep requests from waiting on them
+_task_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='tasks')
+
+# ================================
+# PAGE CACHE
+# ================================
+
+# The page templates take no per-request context, so each renders once per
+# process; debug mode re-renders every hit so template edits show up
+_page_cache: Dict[str, str] = {}
+
+def render_static_page(template_name: str) -> str:
+    """Render a context-free page template, reusing the cached HTML"""
+    html = _page_cache.get(template_name)
+    if html is None:
+        html = render_template(template_name)
+        if not app.debug:
+            _page_cache[template_name] = html
+    return html
 
 # ================================
 # MAIN DASHBOARD ROUTES
@@ -28,27 +450,27 @@ sales_engine = SalesProcessAutomationEngine("../database/sales_automation.db")
 @app.route('/')
 def dashboard():
     """Main sales process dashboard"""
-    return render_template('sales_dashboard.html')
+    return render_static_page('sales_dashboard.html')
 
 @app.route('/discovery')
 def discovery_calls():
     """Discovery calls management page"""
-    return render_template('discovery_calls.html')
+    return render_static_page('discovery_calls.html')
 
 @app.route('/sows')
 def sow_management():
     """SOW management page"""
-    return render_template('sow_management.html')
+    return render_static_page('sow_management.html')
 
 @app.route('/contracts')
 def contract_management():
     """Contract management page"""
-    return render_template('contract_management.html')
+    return render_static_page('contract_management.html')
 
 @app.route('/projects')
 def project_kickoffs():
     """Project kickoff management page"""
-    return render_template('project_kickoffs.html')
+    return render_static_page('project_kickoffs.html')
 
 # ================================
 # API ENDPOINTS
@@ -57,450 +479,394 @@ def project_kickoffs():
 @app.route('/api/dashboard/overview')
 def api_dashboard_overview():
     """Get dashboard overview metrics"""
+    end_date = date.today()
+    start_date = end_date - timedelta(days=30)
+    
+    # Get custom date range if provided
     try:
-        end_date = date.today()
-        start_date = end_date - timedelta(days=30)
-        
-        # Get custom date range if provided
         if request.args.get('start_date'):
             start_date = datetime.strptime(request.args.get('start_date'), '%Y-%m-%d').date()
         if request.args.get('end_date'):
             end_date = datetime.strptime(request.args.get('end_date'), '%Y-%m-%d').date()
-        
-        # Get sales process analytics
-        analytics = sales_engine.get_sales_process_analytics((start_date, end_date))
-        
-        # Get recent activity
-        recent_activity = get_recent_sales_activity()
-        
-        # Get pending items requiring attention
-        pending_items = get_pending_items()
-        
-        overview_data = {
-            "date_range": {
-                "start": start_date.isoformat(),
-                "end": end_date.isoformat()
-            },
-            "key_metrics": {
-                "total_discovery_calls": analytics.get("discovery_calls", {}).get("total_calls", 0),
-                "qualified_leads": analytics.get("discovery_calls", {}).get("qualified_count", 0),
-                "sows_generated": analytics.get("sow_generation", {}).get("total_sows", 0),
-                "contracts_executed": analytics.get("contract_execution", {}).get("executed_count", 0),
-                "total_pipeline_value": f"${analytics.get('sow_generation', {}).get('total_pipeline_value', 0):,.2f}",
-                "closed_revenue": f"${analytics.get('contract_execution', {}).get('closed_revenue', 0):,.2f}",
-                "avg_deal_size": f"${analytics.get('sow_generation', {}).get('avg_project_value', 0):,.2f}"
-            },
-            "conversion_rates": analytics.get("conversion_rates", {}),
-            "automation_efficiency": analytics.get("automation_efficiency", {}),
-            "recent_activity": recent_activity,
-            "pending_items": pending_items
-        }
-        
-        return jsonify(overview_data)
-        
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    except ValueError as e:
+        return ojson({"error": str(e)}, 400)
+    
+    cache_key = (start_date.isoformat(), end_date.isoformat())
+    cached = get_cached_overview(cache_key)
+    if cached is not None:
+        return app.response_class(cached, mimetype='application/json')
+    
+    generation = overview_cache_generation()
+    
+    # Analytics, recent activity and pending items run concurrently
+    analytics_future = _overview_executor.submit(get_sales_analytics, (start_date, end_date))
+    recent_activity_future = _overview_executor.submit(get_recent_sales_activity)
+    pending_items_future = _overview_executor.submit(get_pending_items)
+    
+    analytics = analytics_future.result()
+    recent_activity = recent_activity_future.result()
+    pending_items = pending_items_future.result()
+    
+    discovery_stats = analytics.get("discovery_calls", {})
+    sow_stats = analytics.get("sow_generation", {})
+    contract_stats = analytics.get("contract_execution", {})
+    
+    # Aggregates over an empty range come back NULL, hence the "or 0"
+    overview_data = {
+        "date_range": {
+            "start": start_date.isoformat(),
+            "end": end_date.isoformat()
+        },
+        "key_metrics": {
+            "total_discovery_calls": discovery_stats.get("total_calls") or 0,
+            "qualified_leads": discovery_stats.get("qualified_count") or 0,
+            "sows_generated": sow_stats.get("total_sows") or 0,
+            "contracts_executed": contract_stats.get("executed_count") or 0,
+            "total_pipeline_value": format_currency(sow_stats.get("total_pipeline_value") or 0),
+            "closed_revenue": format_currency(contract_stats.get("closed_revenue") or 0),
+            "avg_deal_size": format_currency(sow_stats.get("avg_project_value") or 0)
+        },
+        "conversion_rates": analytics.get("conversion_rates", {}),
+        "automation_efficiency": analytics.get("automation_efficiency", {}),
+        "recent_activity": recent_activity,
+        "pending_items": pending_items
+    }
+    
+    response = ojson(overview_data)
+    cache_overview(cache_key, response.get_data(), generation)
+    return response
 
 @app.route('/api/discovery/submit', methods=['POST'])
 def api_submit_discovery_call():
     """Submit new discovery call data"""
     try:
-        data = request.json
+        data = orjson.loads(request.get_data())
         
         # Create DiscoveryCallData object
-        call_data = DiscoveryCallData(
-            company_name=data['company_name'],
-            company_size=data['company_size'],
-            industry=data['industry'],
-            annual_revenue=data.get('annual_revenue', 'not_disclosed'),
-            primary_contact_name=data['primary_contact_name'],
-            primary_contact_email=data['primary_contact_email'],
-            primary_contact_title=data['primary_contact_title'],
-            decision_maker_name=data.get('decision_maker_name'),
-            decision_maker_title=data.get('decision_maker_title'),
-            current_challenges=data['current_challenges'],
-            manual_processes=data['manual_processes'],
-            time_waste_hours_weekly=int(data.get('time_waste_hours_weekly', 0)),
-            estimated_cost_inefficiency=float(data.get('estimated_cost_inefficiency', 0)),
-            current_tools_systems=data.get('current_tools_systems', ''),
-            team_size_affected=int(data.get('team_size_affected', 0)),
-            primary_objectives=data['primary_objectives'],
-            success_metrics=data.get('success_metrics', ''),
-            automation_priorities=data.get('automation_priorities', ''),
-            integration_requirements=data.get('integration_requirements', ''),
-            compliance_requirements=data.get('compliance_requirements', ''),
-            security_requirements=data.get('security_requirements', ''),
-            budget_range=data.get('budget_range', 'not_disclosed'),
-            timeline_urgency=data.get('timeline_urgency', '3_months'),
-            decision_timeline=data.get('decision_timeline', '1_month'),
-            roi_expectations=data.get('roi_expectations', ''),
-            sales_rep=data.get('sales_rep', 'Unknown'),
-            call_duration_minutes=int(data.get('call_duration_minutes', 60)),
-            next_steps=data.get('next_steps', ''),
-            call_notes=data.get('call_notes', '')
-        )
-        
-        # Process discovery call
-        call_id = sales_engine.process_discovery_call(
-            prospect_id=data.get('prospect_id', 1),  # TODO: Get from prospect system
-            call_data=call_data
-        )
-        
-        return jsonify({
-            "success": True,
-            "call_id": call_id,
-            "message": "Discovery call processed successfully"
-        })
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 400
+        from sales_automation_engine import DiscoveryCallData
+        call_data = DiscoveryCallData(**extract_fields(data, DISCOVERY_CALL_FIELDS))
+    except (KeyError, TypeError, ValueError) as e:
+        return ojson({"success": False, "error": str(e)}, 400)
+    
+    # Process discovery call
+    call_id = _engine().process_discovery_call(
+        prospect_id=data.get('prospect_id', 1),  # TODO: Get from prospect system
+        call_data=call_data
+    )
+    
+    invalidate_overview_cache()
+    
+    return ojson({
+        "success": True,
+        "call_id": call_id,
+        "message": "Discovery call processed successfully"
+    })
 
 @app.route('/api/discovery/calls')
 def api_get_discovery_calls():
     """Get discovery calls with filtering and pagination"""
-    try:
-        # Query parameters
-        page = int(request.args.get('page', 1))
-        limit = int(request.args.get('limit', 20))
-        status_filter = request.args.get('status')
-        
-        conn = sqlite3.connect("../database/sales_automation.db")
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        # Build query with filters
-        query = """
-            SELECT call_id, company_name, primary_contact_name, industry, company_size,
-                   overall_qualification_score, qualified_status, call_date, sales_rep,
-                   budget_range, timeline_urgency, time_waste_hours_weekly,
-                   estimated_cost_inefficiency
-            FROM discovery_calls 
-            WHERE 1=1
-        """
-        params = []
-        
-        if status_filter:
-            query += " AND qualified_status = ?"
-            params.append(status_filter)
-        
-        query += " ORDER BY call_date DESC LIMIT ? OFFSET ?"
-        params.extend([limit, (page - 1) * limit])
-        
-        cursor.execute(query, params)
-        calls = cursor.fetchall()
-        
-        # Get total count for pagination
-        count_query = "SELECT COUNT(*) as total FROM discovery_calls WHERE 1=1"
-        count_params = []
-        if status_filter:
-            count_query += " AND qualified_status = ?"
-            count_params.append(status_filter)
-        
-        cursor.execute(count_query, count_params)
-        total_count = cursor.fetchone()['total']
-        
-        conn.close()
-        
-        return jsonify({
-            "calls": [dict(call) for call in calls],
+    # Query parameters
+    page = max(request.args.get('page', 1, type=int), 1)
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+    status_filter = request.args.get('status') or None
+    
+    # Keyset cursor from the previous page (preferred over page/OFFSET)
+    after_date = request.args.get('after_date')
+    after_id = request.args.get('after_id', type=int)
+    use_cursor = after_date is not None and after_id is not None
+    
+    cursor = tuple_cursor(get_ro_conn())
+    
+    # Constant SQL text per filter combination keeps statements in the cache
+    params = []
+    if status_filter:
+        params.append(status_filter)
+    if use_cursor:
+        params.extend([after_date, after_id])
+    params.extend([limit, 0 if use_cursor else (page - 1) * limit])
+    
+    cursor.execute(SQL_DISCOVERY_CALLS[(bool(status_filter), use_cursor)], params)
+    rows = cursor.fetchall()
+    calls = [dict(zip(DISCOVERY_CALL_COLUMNS, row)) for row in rows]
+    
+    next_cursor = None
+    if calls and len(calls) == limit:
+        next_cursor = {"after_date": calls[-1]['call_date'], "after_id": calls[-1]['call_id']}
+    
+    if use_cursor:
+        return ojson({
+            "calls": calls,
             "pagination": {
-                "page": page,
                 "limit": limit,
-                "total": total_count,
-                "pages": (total_count + limit - 1) // limit
+                "next_cursor": next_cursor
             }
         })
-        
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    
+    if rows:
+        # _total follows the named columns, so zip() above leaves it out
+        total_count = rows[0][-1]
+    elif page > 1:
+        # Page past the end: no rows to carry the window count
+        if status_filter:
+            cursor.execute(SQL_COUNT_DISCOVERY_CALLS_BY_STATUS, (status_filter,))
+        else:
+            cursor.execute(SQL_COUNT_DISCOVERY_CALLS)
+        total_count = cursor.fetchone()[0]
+    else:
+        total_count = 0
+    
+    return ojson({
+        "calls": calls,
+        "pagination": {
+            "page": page,
+            "limit": limit,
+            "total": total_count,
+            "pages": (total_count + limit - 1) // limit,
+            "next_cursor": next_cursor
+        }
+    })
 
 @app.route('/api/sows/list')
 def api_get_sows():
     """Get generated SOWs with status and details"""
-    try:
-        conn = sqlite3.connect("../database/sales_automation.db")
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT s.sow_id, s.project_title, s.total_project_cost, s.timeline_weeks,
-                   s.sow_status, s.generated_at, s.sent_at, s.approved_at,
-                   d.company_name, d.primary_contact_name
-            FROM generated_sows s
-            JOIN discovery_calls d ON s.discovery_call_id = d.call_id
-            ORDER BY s.generated_at DESC
-            LIMIT 50
-        """)
-        
-        sows = cursor.fetchall()
-        conn.close()
-        
-        return jsonify({
-            "sows": [dict(sow) for sow in sows]
-        })
-        
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    cursor = tuple_cursor(get_ro_conn())
+    
+    cursor.execute(SQL_GET_SOWS)
+    
+    sows = [dict(zip(SOW_COLUMNS, row)) for row in cursor.fetchall()]
+    
+    return conditional_ojson({
+        "sows": sows
+    })
 
 @app.route('/api/sows/<int:sow_id>/approve', methods=['POST'])
 def api_approve_sow(sow_id):
     """Approve SOW and trigger contract generation"""
+    conn = get_conn()
     try:
-        conn = sqlite3.connect("../database/sales_automation.db")
-        cursor = conn.cursor()
-        
-        # Update SOW status
-        cursor.execute("""
-            UPDATE generated_sows 
-            SET sow_status = 'approved', approved_at = CURRENT_TIMESTAMP
-            WHERE sow_id = ?
-        """, (sow_id,))
+        # Approval and contract generation commit together or not at all
+        conn.execute("BEGIN IMMEDIATE")
         
-        conn.commit()
+        # Update SOW status, returning what contract generation needs
+        approved = conn.execute(SQL_APPROVE_SOW, (sow_id,)).fetchall()
+        if not approved:
+            raise ValueError(f"SOW {sow_id} not found")
         
-        # Trigger contract generation
-        contract_id = sales_engine.generate_contract_from_sow(sow_id)
+        # Trigger contract generation from the returned row
+        contract_id = _engine().generate_contract_from_sow(sow_id, conn=conn, sow_row=approved[0])
+        if contract_id is None:
+            raise RuntimeError(f"Contract generation failed for SOW {sow_id}")
         
-        conn.close()
+        conn.commit()
+        invalidate_overview_cache()
         
-        return jsonify({
+        return ojson({
             "success": True,
             "contract_id": contract_id,
             "message": "SOW approved and contract generated"
         })
         
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 400
+    except (ValueError, RuntimeError) as e:
+        conn.rollback()
+        return ojson({"success": False, "error": str(e)}, 400)
+    except Exception:
+        conn.rollback()
+        raise
 
 @app.route('/api/contracts/list')
 def api_get_contracts():
     """Get contracts with status and details"""
-    try:
-        conn = sqlite3.connect("../database/sales_automation.db")
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT c.contract_id, c.contract_number, c.contract_title, 
-                   c.total_contract_value, c.contract_status, c.created_at,
-                   c.sent_for_signature_at, c.fully_executed_at,
-                   c.client_legal_name, c.client_signatory_name
-            FROM generated_contracts c
-            ORDER BY c.created_at DESC
-            LIMIT 50
-        """)
-        
-        contracts = cursor.fetchall()
-        conn.close()
-        
-        return jsonify({
-            "contracts": [dict(contract) for contract in contracts]
-        })
-        
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    cursor = tuple_cursor(get_ro_conn())
+    
+    cursor.execute(SQL_GET_CONTRACTS)
+    
+    contracts = [dict(zip(CONTRACT_COLUMNS, row)) for row in cursor.fetchall()]
+    
+    return conditional_ojson({
+        "contracts": contracts
+    })
 
 @app.route('/api/contracts/<int:contract_id>/send', methods=['POST'])
 def api_send_contract(contract_id):
     """Send contract for e-signature"""
-    try:
-        conn = sqlite3.connect("../database/sales_automation.db")
-        cursor = conn.cursor()
-        
-        # Update contract status
-        cursor.execute("""
-            UPDATE generated_contracts 
-            SET contract_status = 'sent_for_signature', sent_for_signature_at = CURRENT_TIMESTAMP
-            WHERE contract_id = ?
-        """, (contract_id,))
-        
-        conn.commit()
-        conn.close()
-        
-        # TODO: Integrate with DocuSign/HelloSign API
-        
-        return jsonify({
-            "success": True,
-            "message": "Contract sent for signature"
-        })
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 400
+    conn = get_conn()
+    
+    # Update contract status
+    sent = conn.execute("""
+        UPDATE generated_contracts 
+        SET contract_status = 'sent_for_signature', sent_for_signature_at = CURRENT_TIMESTAMP
+        WHERE contract_id = ?
+        RETURNING contract_id
+    """, (contract_id,)).fetchall()
+    if not sent:
+        return ojson({"success": False, "error": f"Contract {contract_id} not found"}, 400)
+    
+    invalidate_overview_cache()
+    
+    # TODO: Integrate with DocuSign/HelloSign API
+    
+    return ojson({
+        "success": True,
+        "message": "Contract sent for signature"
+    })
 
 @app.route('/api/contracts/<int:contract_id>/execute', methods=['POST'])
 def api_execute_contract(contract_id):
-    """Mark contract as fully executed and trigger payment setup"""
+    """Mark contract as fully executed and queue payment setup and kickoff"""
+    conn = get_conn()
     try:
-        conn = sqlite3.connect("../database/sales_automation.db")
-        cursor = conn.cursor()
+        conn.execute("BEGIN IMMEDIATE")
         
         # Update contract status
-        cursor.execute("""
+        executed = conn.execute("""
             UPDATE generated_contracts 
             SET contract_status = 'fully_executed', fully_executed_at = CURRENT_TIMESTAMP
             WHERE contract_id = ?
-        """, (contract_id,))
+            RETURNING contract_id
+        """, (contract_id,)).fetchall()
+        if not executed:
+            raise ValueError(f"Contract {contract_id} not found")
+        
+        task_id = uuid.uuid4().hex
+        conn.execute("""
+            INSERT INTO background_tasks (task_id, task_type, source_record_id)
+            VALUES (?, 'contract_execution', ?)
+        """, (task_id, contract_id))
         
         conn.commit()
-        conn.close()
+        invalidate_overview_cache()
+        
+    except (ValueError, RuntimeError) as e:
+        conn.rollback()
+        return ojson({"success": False, "error": str(e)}, 400)
+    except Exception:
+        conn.rollback()
+        raise
+    
+    # Payment setup and kickoff run off the request thread; poll /api/tasks/<task_id>
+    _task_executor.submit(_finalize_execution, contract_id, task_id)
+    
+    return ojson({
+        "success": True,
+        "task_id": task_id,
+        "message": "Contract executed; payment setup and project kickoff queued"
+    }, 202)
+
+def _finalize_execution(contract_id: int, task_id: str):
+    """Background task: set up payment processing and trigger project kickoff"""
+    conn = get_conn()
+    try:
+        conn.execute(
+            "UPDATE background_tasks SET task_status = 'running' WHERE task_id = ?", (task_id,)
+        )
         
-        # Setup payment processing
-        config_id = sales_engine.setup_payment_processing(contract_id)
+        # Payment setup, kickoff and the task result commit together or not at all
+        conn.execute("BEGIN IMMEDIATE")
         
-        # Trigger project kickoff
-        kickoff_id = sales_engine.trigger_project_kickoff(contract_id)
+        config_id = _engine().setup_payment_processing(contract_id, conn=conn)
+        if config_id is None:
+            raise RuntimeError(f"Payment setup failed for contract {contract_id}")
         
-        return jsonify({
-            "success": True,
-            "payment_config_id": config_id,
-            "kickoff_id": kickoff_id,
-            "message": "Contract executed, payment setup, and project kickoff initiated"
-        })
+        # None until the first payment is received
+        kickoff_id = _engine().trigger_project_kickoff(contract_id, conn=conn)
+        
+        conn.execute("""
+            UPDATE background_tasks
+            SET task_status = 'completed', task_result = ?, completed_at = CURRENT_TIMESTAMP
+            WHERE task_id = ?
+        """, (orjson.dumps({"payment_config_id": config_id, "kickoff_id": kickoff_id}), task_id))
+        
+        conn.commit()
+        invalidate_overview_cache()
         
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 400
+        logger.exception(f"Task {task_id} failed for contract {contract_id}")
+        if conn.in_transaction:
+            conn.rollback()
+        # Recorded in its own transaction; if even that fails, log it rather than
+        # losing the error inside the executor
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("""
+                UPDATE background_tasks
+                SET task_status = 'failed', error_message = ?, completed_at = CURRENT_TIMESTAMP
+                WHERE task_id = ?
+            """, (str(e), task_id))
+            conn.commit()
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.rollback()
+            logger.exception(f"Could not mark task {task_id} failed after: {e}")
 
 @app.route('/api/projects/list')
 def api_get_projects():
     """Get project kickoffs with status"""
-    try:
-        conn = sqlite3.connect("../database/sales_automation.db")
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT pk.kickoff_id, pk.project_code, pk.project_name, 
-                   pk.project_manager, pk.kickoff_status, pk.created_at,
-                   pk.kickoff_scheduled_date, pk.kickoff_completed_date,
-                   c.total_contract_value, c.client_legal_name
-            FROM project_kickoffs pk
-            JOIN generated_contracts c ON pk.contract_id = c.contract_id
-            ORDER BY pk.created_at DESC
-            LIMIT 50
-        """)
-        
-        projects = cursor.fetchall()
-        conn.close()
-        
-        return jsonify({
-            "projects": [dict(project) for project in projects]
-        })
-        
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    cursor = tuple_cursor(get_ro_conn())
+    
+    cursor.execute(SQL_GET_PROJECTS)
+    
+    projects = [dict(zip(PROJECT_COLUMNS, row)) for row in cursor.fetchall()]
+    
+    return conditional_ojson({
+        "projects": projects
+    })
+
+@app.route('/api/tasks/<task_id>')
+def api_get_task(task_id):
+    """Get the status and result of a background task"""
+    cursor = tuple_cursor(get_ro_conn())
+    cursor.execute(SQL_GET_TASK, (task_id,))
+    row = cursor.fetchone()
+    if row is None:
+        return ojson({"error": "Task not found"}, 404)
+    
+    task = dict(zip(TASK_COLUMNS, row))
+    if task['task_result']:
+        task['task_result'] = orjson.loads(task['task_result'])
+    
+    return ojson(task)
 
 @app.route('/api/workflow/status')
 def api_get_workflow_status():
     """Get workflow automation status and logs"""
-    try:
-        process_type = request.args.get('process_type')
-        status = request.args.get('status')
-        
-        workflow_logs = sales_engine.get_workflow_status(process_type, status)
-        
-        return jsonify({
-            "workflow_logs": workflow_logs
-        })
-        
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    process_type = request.args.get('process_type')
+    status = request.args.get('status')
+    limit = request.args.get('limit', 100, type=int)
+    offset = request.args.get('offset', 0, type=int)
+    
+    workflow_logs = _engine().get_workflow_status_list(process_type, status, limit, offset)
+    
+    return ojson({
+        "workflow_logs": workflow_logs
+    })
 
 # ================================
 # HELPER FUNCTIONS
 # ================================
 
+def get_sales_analytics(date_range):
+    """Get sales process analytics on the calling thread's read-only connection"""
+    return _engine().get_sales_process_analytics(date_range, conn=get_ro_conn())
+
 def get_recent_sales_activity():
-    """Get recent sales activity for dashboard"""
-    try:
-        conn = sqlite3.connect("../database/sales_automation.db")
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        activities = []
-        
-        # Recent discovery calls
-        cursor.execute("""
-            SELECT 'discovery_call' as type, company_name as description, call_date as timestamp
-            FROM discovery_calls 
-            WHERE call_date >= datetime('now', '-7 days')
-            ORDER BY call_date DESC
-            LIMIT 5
-        """)
-        activities.extend(cursor.fetchall())
-        
-        # Recent SOW generations
-        cursor.execute("""
-            SELECT 'sow_generated' as type, 
-                   'SOW generated for ' || d.company_name as description,
-                   s.generated_at as timestamp
-            FROM generated_sows s
-            JOIN discovery_calls d ON s.discovery_call_id = d.call_id
-            WHERE s.generated_at >= datetime('now', '-7 days')
-            ORDER BY s.generated_at DESC
-            LIMIT 5
-        """)
-        activities.extend(cursor.fetchall())
-        
-        # Recent contract executions
-        cursor.execute("""
-            SELECT 'contract_executed' as type,
-                   'Contract executed for ' || client_legal_name as description,
-                   fully_executed_at as timestamp
-            FROM generated_contracts
-            WHERE fully_executed_at >= datetime('now', '-7 days')
-            ORDER BY fully_executed_at DESC
-            LIMIT 5
-        """)
-        activities.extend(cursor.fetchall())
-        
-        conn.close()
-        
-        # Sort all activities by timestamp
-        activities = sorted(activities, key=lambda x: x['timestamp'], reverse=True)
-        
-        return [dict(activity) for activity in activities[:10]]
-        
-    except Exception as e:
-        return []
+    """Get recent sales activity for dashboard; errors propagate through the
+    overview future to the unhandled-exception handler"""
+    cursor = tuple_cursor(get_ro_conn())
+    
+    # Latest five of each activity type, merged and ordered by SQLite; the
+    # window start is bound once (timestamps are stored as UTC CURRENT_TIMESTAMP)
+    cutoff = datetime.now(timezone.utc) - timedelta(days=RECENT_ACTIVITY_DAYS)
+    cursor.execute(SQL_RECENT_ACTIVITY, {"cutoff": cutoff.strftime('%Y-%m-%d %H:%M:%S')})
+    
+    return [dict(zip(ACTIVITY_COLUMNS, row)) for row in cursor.fetchall()]
 
 def get_pending_items():
     """Get items requiring attention"""
-    try:
-        conn = sqlite3.connect("../database/sales_automation.db")
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        pending = {
-            "sows_pending_review": 0,
-            "contracts_pending_signature": 0,
-            "projects_pending_kickoff": 0,
-            "overdue_payments": 0
-        }
-        
-        # SOWs pending review
-        cursor.execute("SELECT COUNT(*) as count FROM generated_sows WHERE sow_status = 'review'")
-        pending["sows_pending_review"] = cursor.fetchone()['count']
-        
-        # Contracts pending signature
-        cursor.execute("SELECT COUNT(*) as count FROM generated_contracts WHERE contract_status = 'sent_for_signature'")
-        pending["contracts_pending_signature"] = cursor.fetchone()['count']
-        
-        # Projects pending kickoff
-        cursor.execute("SELECT COUNT(*) as count FROM project_kickoffs WHERE kickoff_status = 'pending'")
-        pending["projects_pending_kickoff"] = cursor.fetchone()['count']
-        
-        # Overdue payments
-        cursor.execute("""
-            SELECT COUNT(*) as count FROM payment_transactions 
-            WHERE transaction_status = 'pending' AND invoice_due_date < date('now')
-        """)
-        pending["overdue_payments"] = cursor.fetchone()['count']
-        
-        conn.close()
-        return pending
-        
-    except Exception as e:
-        return {}
+    cursor = tuple_cursor(get_ro_conn())
+    
+    # All four counts in a single round-trip
+    cursor.execute(SQL_PENDING_ITEMS)
+    return dict(zip(PENDING_ITEM_COLUMNS, cursor.fetchone()))
 
 # ================================
 # ERROR HANDLERS
@@ -508,11 +874,19 @@ def get_pending_items():
 
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({"error": "Endpoint not found"}), 404
+    return ojson({"error": "Endpoint not found"}, 404)
 
 @app.errorhandler(500)
 def internal_error(error):
-    return jsonify({"error": "Internal server error"}), 500
+    return ojson({"error": "Internal server error"}, 500)
+
+@app.errorhandler(Exception)
+def unhandled_exception(error):
+    # HTTP errors (405, 413, ...) keep their own status and response
+    if isinstance(error, HTTPException):
+        return error
+    logger.exception(f"Unhandled error on {request.method} {request.path}")
+    return ojson({"error": "Internal server error"}, 500)
 
 # ================================
 # MAIN APPLICATION
@@ -520,16 +894,19 @@ def internal_error(error):
 
 if __name__ == '__main__':
     # Ensure database exists
-    if not os.path.exists("../database/sales_automation.db"):
+    if not os.path.exists(DB_PATH):
         print("Warning: Database not found. Please run database initialization first.")
+    else:
+        ensure_dashboard_indexes()
     
     print("Starting Entelech Sales Process Automation Dashboard...")
     print("Dashboard will be available at: http://localhost:5002")
     print("Features: Discovery calls, SOW generation, Contract management, Project kickoffs")
     
+    # Local development only; production runs under gunicorn via wsgi.py
     app.run(
         host='0.0.0.0',
         port=5002,
-        debug=True,
+        debug=os.environ.get('FLASK_ENV') == 'development',
         threaded=True
     )
\ No newline at end of file
@@ -0,0 +1,13 @@
+"""
+Entelech Sales Process Automation Dashboard - WSGI Entry Point
+Production server entry for gunicorn:
+
+    cd dashboard && gunicorn -k gthread -w 4 --threads 8 -b 0.0.0.0:5002 wsgi:app
+"""
+
+import os
+
+from sales_dashboard import app, ensure_dashboard_indexes, DB_PATH
+
+if os.path.exists(DB_PATH):
+    ensure_dashboard_indexes()
@@ -467,6 +467,21 @@ CREATE TABLE workflow_automation_log (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Background Tasks (deferred dashboard work, polled via /api/tasks/<id>)
+CREATE TABLE background_tasks (
+    task_id VARCHAR(32) PRIMARY KEY,
+    task_type VARCHAR(100) NOT NULL,
+    source_record_id INT NOT NULL,
+    task_status ENUM('queued', 'running', 'completed', 'failed') DEFAULT 'queued',
+    
+    -- Results
+    task_result JSON,
+    error_message TEXT NULL,
+    
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    completed_at TIMESTAMP NULL
+);
+
 -- ================================
 -- CONFIGURATION & SETTINGS
 -- ================================
@@ -501,14 +516,18 @@ INSERT INTO system_configuration (config_key, config_value, config_description,
 CREATE INDEX idx_discovery_prospect ON discovery_calls(prospect_id);
 CREATE INDEX idx_discovery_date ON discovery_calls(call_date);
 CREATE INDEX idx_discovery_qualified ON discovery_calls(qualified_status);
-CREATE INDEX idx_sow_discovery ON generated_sows(discovery_call_id);
+CREATE INDEX idx_discovery_status_date ON discovery_calls(qualified_status, call_date DESC, call_id DESC);
+CREATE INDEX idx_sow_discovery_status ON generated_sows(discovery_call_id, sow_status, total_project_cost);
 CREATE INDEX idx_sow_status ON generated_sows(sow_status);
-CREATE INDEX idx_contract_sow ON generated_contracts(sow_id);
+CREATE INDEX idx_sow_generated ON generated_sows(generated_at);
+CREATE INDEX idx_contract_sow_status ON generated_contracts(sow_id, contract_status);
 CREATE INDEX idx_contract_status ON generated_contracts(contract_status);
+CREATE INDEX idx_contract_executed ON generated_contracts(fully_executed_at);
 CREATE INDEX idx_payment_config_contract ON payment_configurations(contract_id);
-CREATE INDEX idx_payment_transaction_config ON payment_transactions(config_id);
+CREATE INDEX idx_payment_transaction_config_status ON payment_transactions(config_id, transaction_status, transaction_type);
 CREATE INDEX idx_payment_status ON payment_transactions(transaction_status);
 CREATE INDEX idx_kickoff_contract ON project_kickoffs(contract_id);
 CREATE INDEX idx_kickoff_status ON project_kickoffs(kickoff_status);
 CREATE INDEX idx_workflow_log_type ON workflow_automation_log(process_type);
-CREATE INDEX idx_workflow_log_status ON workflow_automation_log(automation_status);
\ No newline at end of file
+CREATE INDEX idx_workflow_log_status ON workflow_automation_log(automation_status);
+CREATE INDEX idx_workflow_log_start ON workflow_automation_log(processing_start_time, process_type);
\ No newline at end of file
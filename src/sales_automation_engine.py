@@ -5,26 +5,37 @@ End-to-end sales workflow automation from discovery to project kickoff
 
 import sqlite3
 import json
+import orjson
 from datetime import datetime, timedelta, date
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, FrozenSet, Iterator, List, Any, Optional, Tuple, TYPE_CHECKING
+from dataclasses import dataclass, fields
 from enum import Enum
 import logging
 import hashlib
-from decimal import Decimal
-import uuid
+import re
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from bisect import bisect_left, bisect_right
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-class QualificationStatus(Enum):
+# Status enums mix in str so members bind to SQLite and compare with stored values as-is
+class QualificationStatus(str, Enum):
     QUALIFIED = "qualified"
     DISQUALIFIED = "disqualified"
     NURTURE = "nurture"
     PENDING_REVIEW = "pending_review"
 
-class SOWStatus(Enum):
+class SOWStatus(str, Enum):
     DRAFT = "draft"
     REVIEW = "review"
     SENT = "sent"
@@ -32,7 +43,7 @@ class SOWStatus(Enum):
     REJECTED = "rejected"
     EXPIRED = "expired"
 
-class ContractStatus(Enum):
+class ContractStatus(str, Enum):
     DRAFT = "draft"
     REVIEW = "review"
     SENT_FOR_SIGNATURE = "sent_for_signature"
@@ -41,7 +52,440 @@ class ContractStatus(Enum):
     EXPIRED = "expired"
     CANCELLED = "cancelled"
 
-@dataclass
+class ServiceCategory(str, Enum):
+    """Service catalog categories; members compare and hash equal to the stored strings"""
+    AUTOMATION_DEVELOPMENT = "automation_development"
+    PROCESS_OPTIMIZATION = "process_optimization"
+    INTEGRATION_SETUP = "integration_setup"
+    ONGOING_MANAGEMENT = "ongoing_management"
+    CONSULTING = "consulting"
+    TRAINING = "training"
+
+# ================================
+# QUALIFICATION SCORING TABLES
+# ================================
+
+# Tiered pain-level points: a value strictly above the i-th threshold earns the
+# (i + 1)-th points entry, looked up with bisect_left
+_PAIN_HOURS_THRESHOLDS = (5, 10, 20)
+_PAIN_HOURS_POINTS = (0, 1, 2, 4)
+_PAIN_COST_THRESHOLDS = (10000, 25000, 50000, 100000)
+_PAIN_COST_POINTS = (0, 1, 2, 3, 4)
+_PAIN_TEAM_THRESHOLDS = (5, 10)
+_PAIN_TEAM_POINTS = (0, 1, 2)
+
+_BUDGET_SCORES = {
+    "under_25k": 2,
+    "25k_50k": 4,
+    "50k_100k": 6,
+    "100k_250k": 8,
+    "250k_plus": 10,
+    "not_disclosed": 3
+}
+
+_URGENCY_SCORES = {
+    "immediate": 10,
+    "1_month": 8,
+    "3_months": 6,
+    "6_months": 4,
+    "12_months": 2
+}
+
+_COMPANY_SIZE_SCORES = {
+    "11-50": 2,
+    "51-200": 3,
+    "201-500": 2,
+    "501-1000": 1,
+    "1000+": 1,
+    "1-10": 1
+}
+
+# Integration mentions counted in lowercased requirements; substrings like
+# "systems" count, as with str.count
+_INTEGRATION_MENTION_RE = re.compile(r"api|system")
+
+_HIGH_FIT_INDUSTRIES = frozenset({"technology", "professional services", "healthcare", "finance", "real estate"})
+
+# Overall score at or above each threshold moves up one status (bisect_right)
+_QUALIFICATION_THRESHOLDS = (30, 50, 70)
+_QUALIFICATION_STATUSES = (
+    QualificationStatus.DISQUALIFIED,
+    QualificationStatus.PENDING_REVIEW,
+    QualificationStatus.NURTURE,
+    QualificationStatus.QUALIFIED
+)
+
+# ================================
+# PRICING TABLES
+# ================================
+
+# Company size adjustments, as a fraction of base cost
+_SIZE_ADJUSTMENTS = {
+    "1-10": -0.15,      # 15% discount for small companies
+    "11-50": -0.05,     # 5% discount
+    "51-200": 0.0,      # Standard pricing
+    "201-500": 0.1,     # 10% premium
+    "501-1000": 0.15,   # 15% premium
+    "1000+": 0.2        # 20% premium
+}
+
+_INDUSTRY_PREMIUMS = {
+    "healthcare": 0.15,
+    "finance": 0.20,
+    "government": 0.25
+}
+
+_URGENCY_PREMIUMS = {
+    "immediate": 0.25,
+    "1_month": 0.15,
+    "3_months": 0.05,
+    "6_months": 0.0,
+    "12_months": -0.05
+}
+
+# Payment milestones (name, percentage, fraction of total, description) by
+# project size: a total at or above each threshold moves to the next schedule
+_PAYMENT_SCHEDULE_THRESHOLDS = (50000, 150000)
+_PAYMENT_SCHEDULES = (
+    # Small projects: 50% upfront, 50% on completion
+    (
+        ("Project Start", 50.0, 0.5, "Initial payment to begin project development"),
+        ("Project Completion", 50.0, 0.5, "Final payment upon successful project delivery")
+    ),
+    # Medium projects: 30% / 40% / 30%
+    (
+        ("Project Start", 30.0, 0.3, "Initial payment to begin project development"),
+        ("Development Milestone", 40.0, 0.4, "Payment upon completion of core development"),
+        ("Project Completion", 30.0, 0.3, "Final payment upon successful project delivery")
+    ),
+    # Large projects: 25% / 25% / 25% / 25%
+    (
+        ("Project Start", 25.0, 0.25, "Initial payment to begin project development"),
+        ("Development Phase 1", 25.0, 0.25, "Payment upon completion of phase 1 development"),
+        ("Development Phase 2", 25.0, 0.25, "Payment upon completion of phase 2 development"),
+        ("Project Completion", 25.0, 0.25, "Final payment upon successful project delivery")
+    )
+)
+
+# Company sizes that get ongoing management recommended
+_ONGOING_MANAGEMENT_SIZES = frozenset({"201-500", "501-1000", "1000+"})
+
+# ================================
+# SOW CONTENT TEMPLATES
+# ================================
+
+_SOW_DEFAULT_SUCCESS_CRITERIA = """
+        - 80% reduction in manual processing time
+        - 95% accuracy in automated processes
+        - ROI achievement within 12 months
+        - Full team adoption and utilization
+        - Seamless integration with existing systems
+        """
+
+_AUTOMATION_DEVELOPMENT_DELIVERABLES = (
+    "Custom automation workflows and business logic",
+    "User interface for process management",
+    "System integration and API connections",
+    "Data migration and cleanup processes"
+)
+_PROCESS_OPTIMIZATION_DELIVERABLES = (
+    "Process analysis and optimization recommendations",
+    "Workflow redesign and efficiency improvements",
+    "Standard operating procedures documentation"
+)
+_INTEGRATION_SETUP_DELIVERABLES = (
+    "API integrations with existing systems",
+    "Data synchronization and mapping",
+    "Integration testing and validation"
+)
+_TRAINING_DELIVERABLES = (
+    "User training materials and documentation",
+    "Live training sessions for team members",
+    "Ongoing support and knowledge transfer"
+)
+
+# SOW deliverables per service category; categories not listed add none
+_DELIVERABLES_BY_CATEGORY = {
+    ServiceCategory.AUTOMATION_DEVELOPMENT: _AUTOMATION_DEVELOPMENT_DELIVERABLES,
+    ServiceCategory.PROCESS_OPTIMIZATION: _PROCESS_OPTIMIZATION_DELIVERABLES,
+    ServiceCategory.INTEGRATION_SETUP: _INTEGRATION_SETUP_DELIVERABLES,
+    ServiceCategory.TRAINING: _TRAINING_DELIVERABLES
+}
+
+@lru_cache(maxsize=32)
+def _sow_deliverables(categories: FrozenSet[str]) -> str:
+    """Bulleted SOW deliverables for a service bundle, in the order services are recommended"""
+    return "\\n".join(
+        f"• {item}"
+        for category, deliverables in _DELIVERABLES_BY_CATEGORY.items() if category in categories
+        for item in deliverables
+    )
+
+# Phase 2's duration_weeks is filled in per SOW from the estimated hours
+_SOW_PHASES = (
+    {
+        "phase": 1,
+        "name": "Discovery & Planning",
+        "duration_weeks": 1,
+        "description": "Detailed requirements analysis, system architecture design, and project planning"
+    },
+    {
+        "phase": 2,
+        "name": "Development & Integration",
+        "duration_weeks": None,
+        "description": "Core automation development, system integrations, and testing"
+    },
+    {
+        "phase": 3,
+        "name": "Testing & Training",
+        "duration_weeks": 1,
+        "description": "User acceptance testing, team training, and knowledge transfer"
+    },
+    {
+        "phase": 4,
+        "name": "Launch & Support",
+        "duration_weeks": 1,
+        "description": "Production deployment, go-live support, and transition to operations"
+    }
+)
+
+_SOW_EXCLUSIONS = """
+        • Third-party software licensing costs (client responsibility)
+        • Hardware or infrastructure costs beyond software development
+        • Ongoing maintenance beyond 30-day warranty period
+        • Changes to original scope without formal change request approval
+        • Training for more than 10 users (additional training available separately)
+        """
+
+_SOW_ASSUMPTIONS_TEMPLATE = """
+        • Client will provide timely access to required systems and stakeholders
+        • Existing systems have available APIs or integration capabilities
+        • Client technical team will be available for collaboration and testing
+        • Project timeline assumes standard business hours (M-F, 9-5 {company_name} timezone)
+        • No major system changes will occur during project implementation
+        """
+
+_SOW_CHANGE_REQUEST_PROCESS = """
+        All changes to project scope must be documented in writing and approved by both parties. 
+        Change requests will be evaluated for impact on timeline, cost, and deliverables. 
+        Additional work will be billed at standard hourly rates with prior approval.
+        """
+
+_SOW_ACCEPTANCE_CRITERIA = """
+        Each deliverable will be considered complete upon successful demonstration of functionality, 
+        passing of all defined tests, and written acceptance by client project stakeholder. 
+        Final project acceptance requires successful completion of all deliverables and 
+        30-day production stability period.
+        """
+
+# ================================
+# CONTRACT TEMPLATES
+# ================================
+
+_CONTRACT_VARIABLE_RE = re.compile(r"(\{\{[A-Z_]+\}\})")
+
+@lru_cache(maxsize=16)
+def _contract_template_tokens(template_content: str) -> Tuple[str, ...]:
+    """Split a contract template once into literal text and {{VARIABLE}} tokens"""
+    return tuple(_CONTRACT_VARIABLE_RE.split(template_content))
+
+# ================================
+# SQL STATEMENTS
+# ================================
+
+# Active service catalog is cached per engine; it changes far less often than SOWs are generated
+_SERVICE_CATALOG_TTL_SECONDS = 300
+
+def _weeks_from_hours(hours: int) -> int:
+    """Whole 40-hour weeks needed to cover the given hours (at least one)"""
+    return max(1, -(-hours // 40))
+
+def _percentage(part: int, whole: int) -> float:
+    """part as a percentage of whole; 0 when there is no whole"""
+    return part / whole * 100 if whole > 0 else 0
+
+def _json_column(value: Any) -> str:
+    """Serialize a JSON column value (dataclasses included) as compact UTF-8 text"""
+    return orjson.dumps(value, option=orjson.OPT_SERIALIZE_DATACLASS).decode()
+
+_INSERT_WORKFLOW_LOG_SQL = """
+    INSERT INTO workflow_automation_log (
+        process_type, source_record_id, target_record_id, automation_trigger,
+        automation_action, automation_status, automation_result, triggered_by_user
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Only the discovery fields SOW generation reads; skips call notes and the
+# other long free-text columns
+_SELECT_SOW_SOURCE_SQL = """
+    SELECT company_name, company_size, industry,
+           current_challenges, primary_objectives, success_metrics,
+           time_waste_hours_weekly, estimated_cost_inefficiency, team_size_affected,
+           integration_requirements, compliance_requirements, security_requirements,
+           timeline_urgency
+    FROM discovery_calls WHERE call_id = ?
+"""
+
+_INSERT_SOW_SQL = """
+    INSERT INTO generated_sows (
+        discovery_call_id, project_title, project_description,
+        business_objectives, success_criteria, included_services,
+        deliverables, timeline_weeks, project_phases,
+        base_services_cost, additional_services_cost, complexity_adjustments,
+        discounts_applied, total_project_cost, payment_schedule,
+        exclusions, assumptions, change_request_process, acceptance_criteria,
+        expires_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now', '+30 days'))
+"""
+
+_SELECT_ACTIVE_SERVICES_SQL = """
+    SELECT service_id, service_name, service_category, base_price, base_hours_required
+    FROM service_catalog WHERE is_active = 1
+    ORDER BY service_id
+"""
+
+# SOW and client fields contract generation reads; the dashboard's approve
+# statement RETURNs the same columns
+_CONTRACT_SOURCE_SELECT = """
+    SELECT s.sow_id, s.sow_status, s.project_title, s.project_description, s.deliverables,
+           s.timeline_weeks, s.total_project_cost, s.payment_schedule, s.payment_terms,
+           d.company_name, d.primary_contact_name, d.primary_contact_title, d.primary_contact_email
+    FROM generated_sows s
+    JOIN discovery_calls d ON s.discovery_call_id = d.call_id
+"""
+_SELECT_CONTRACT_SOURCE_SQL = _CONTRACT_SOURCE_SELECT + "    WHERE s.sow_id = ?\n"
+# Bulk form takes the SOW ids as one JSON array, so the statement text is
+# the same for any batch size
+_SELECT_CONTRACT_SOURCES_SQL = _CONTRACT_SOURCE_SELECT + "    WHERE s.sow_id IN (SELECT value FROM json_each(?))\n"
+
+_SELECT_CONTRACT_TEMPLATE_SQL = """
+    SELECT template_content, governing_law, liability_cap_percentage, warranty_period_months
+    FROM contract_templates WHERE template_id = ?
+"""
+
+_INSERT_CONTRACT_SQL = """
+    INSERT INTO generated_contracts (
+        sow_id, template_id, contract_number, contract_title,
+        client_legal_name, client_address, client_signatory_name,
+        client_signatory_title, client_signatory_email,
+        provider_signatory_name, provider_signatory_title,
+        total_contract_value, payment_schedule,
+        project_start_date, project_end_date, contract_effective_date, contract_expiration_date,
+        contract_content, contract_hash
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SELECT_PAYMENT_SOURCE_SQL = """
+    SELECT contract_number, total_contract_value, payment_schedule
+    FROM generated_contracts
+    WHERE contract_id = ? AND contract_status = 'fully_executed'
+"""
+
+_INSERT_PAYMENT_CONFIGURATION_SQL = """
+    INSERT INTO payment_configurations (
+        contract_id, payment_provider, payment_type, total_amount,
+        currency, payment_schedule, auto_invoice_enabled, late_fee_enabled
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_INVOICE_SQL = """
+    INSERT INTO payment_transactions (
+        config_id, transaction_type, amount, invoice_number,
+        invoice_due_date, milestone_description, payment_method,
+        transaction_status
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SELECT_KICKOFF_SOURCE_SQL = """
+    SELECT s.project_title, s.included_services
+    FROM generated_contracts c
+    JOIN generated_sows s ON c.sow_id = s.sow_id
+    WHERE c.contract_id = ?
+"""
+
+# Stops at the first completed payment instead of counting them all
+_SELECT_COMPLETED_PAYMENT_SQL = """
+    SELECT 1 FROM payment_configurations pc
+    JOIN payment_transactions pt ON pc.config_id = pt.config_id
+    WHERE pc.contract_id = ? AND pt.transaction_status = 'completed'
+    AND pt.transaction_type = 'payment'
+    LIMIT 1
+"""
+
+_INSERT_PROJECT_KICKOFF_SQL = """
+    INSERT INTO project_kickoffs (
+        contract_id, template_id, project_code, project_name,
+        project_manager, kickoff_scheduled_date
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# Copies the template's deliverables JSON as stored; no row comes back when
+# the template does not exist
+_UPDATE_KICKOFF_DELIVERABLES_SQL = """
+    UPDATE project_kickoffs
+    SET kickoff_deliverables = t.initial_deliverables
+    FROM kickoff_templates t
+    WHERE t.template_id = ? AND project_kickoffs.kickoff_id = ?
+    RETURNING json_array_length(kickoff_deliverables) AS deliverable_count
+"""
+
+# Each CTE aggregates at its own grain, so a call with several SOWs (or a SOW
+# with several contracts) is not double-counted; calls and sows are each used
+# twice and so are materialized once
+_SALES_FUNNEL_ANALYTICS_SQL = """
+    WITH calls AS (
+        SELECT call_id, overall_qualification_score, qualified_status, call_duration_minutes,
+               time_waste_hours_weekly, estimated_cost_inefficiency
+        FROM discovery_calls
+        WHERE call_date BETWEEN ? AND ?
+    ),
+    sows AS (
+        SELECT s.sow_id, s.sow_status, s.total_project_cost, s.timeline_weeks
+        FROM generated_sows s
+        JOIN calls d ON s.discovery_call_id = d.call_id
+    ),
+    discovery_stats AS (
+        SELECT 
+            COUNT(*) as total_calls,
+            AVG(overall_qualification_score) as avg_qualification_score,
+            COALESCE(SUM(CASE WHEN qualified_status = 'qualified' THEN 1 ELSE 0 END), 0) as qualified_count,
+            AVG(call_duration_minutes) as avg_call_duration,
+            AVG(time_waste_hours_weekly) as avg_time_waste,
+            AVG(estimated_cost_inefficiency) as avg_cost_inefficiency
+        FROM calls
+    ),
+    sow_stats AS (
+        SELECT 
+            COUNT(*) as total_sows,
+            COALESCE(SUM(CASE WHEN sow_status = 'approved' THEN 1 ELSE 0 END), 0) as approved_count,
+            AVG(total_project_cost) as avg_project_value,
+            COALESCE(SUM(total_project_cost), 0) as total_pipeline_value,
+            AVG(timeline_weeks) as avg_timeline_weeks
+        FROM sows
+    ),
+    contract_stats AS (
+        SELECT 
+            COUNT(*) as total_contracts,
+            COALESCE(SUM(CASE WHEN contract_status = 'fully_executed' THEN 1 ELSE 0 END), 0) as executed_count,
+            COALESCE(SUM(CASE WHEN contract_status = 'fully_executed' THEN total_contract_value ELSE 0 END), 0) as closed_revenue,
+            AVG(CASE WHEN fully_executed_at IS NOT NULL 
+                THEN julianday(fully_executed_at) - julianday(sent_for_signature_at) ELSE NULL END) as avg_signing_days
+        FROM generated_contracts c
+        JOIN sows s ON c.sow_id = s.sow_id
+    )
+    SELECT * FROM discovery_stats, sow_stats, contract_stats
+"""
+
+_DISCOVERY_ANALYTICS_COLUMNS = (
+    "total_calls", "avg_qualification_score", "qualified_count",
+    "avg_call_duration", "avg_time_waste", "avg_cost_inefficiency"
+)
+_SOW_ANALYTICS_COLUMNS = (
+    "total_sows", "approved_count", "avg_project_value", "total_pipeline_value", "avg_timeline_weeks"
+)
+_CONTRACT_ANALYTICS_COLUMNS = ("total_contracts", "executed_count", "closed_revenue", "avg_signing_days")
+
+@dataclass(slots=True)
 class DiscoveryCallData:
     """Data structure for discovery call information"""
     # Company Information
@@ -85,7 +529,29 @@ class DiscoveryCallData:
     next_steps: str = ""
     call_notes: str = ""
 
-@dataclass
+# discovery_calls score columns, keyed by _calculate_qualification_scores result key
+_DISCOVERY_SCORE_COLUMNS = {
+    "pain_level": "pain_level_score",
+    "budget_authority": "budget_authority_score",
+    "timeline_urgency": "timeline_urgency_score",
+    "technical_fit": "technical_fit_score",
+    "overall_score": "overall_qualification_score",
+    "status": "qualified_status"
+}
+
+# The insert is derived from DiscoveryCallData (its field names are the column
+# names) so the two cannot drift; built once at import so every call binds the
+# same statement text, with values read in one C call each
+_DISCOVERY_CALL_FIELDS = tuple(field.name for field in fields(DiscoveryCallData))
+_discovery_call_values = attrgetter(*_DISCOVERY_CALL_FIELDS)
+_discovery_call_scores = itemgetter(*_DISCOVERY_SCORE_COLUMNS)
+_DISCOVERY_CALL_COLUMNS = ("prospect_id", *_DISCOVERY_CALL_FIELDS, *_DISCOVERY_SCORE_COLUMNS.values())
+_INSERT_DISCOVERY_CALL_SQL = (
+    f"INSERT INTO discovery_calls ({', '.join(_DISCOVERY_CALL_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_DISCOVERY_CALL_COLUMNS))})"
+)
+
+@dataclass(slots=True)
 class ServiceConfiguration:
     """Configuration for a service in the catalog"""
     service_id: int
@@ -110,28 +576,94 @@ class PricingBreakdown:
 class SalesProcessAutomationEngine:
     """Core engine for automating the sales process from discovery to project kickoff"""
     
-    def __init__(self, db_path: str = "sales_automation.db"):
+    def __init__(self, db_path: str = "sales_automation.db", pool_size: int = 4):
         """Initialize the sales automation engine"""
         self.db_path = db_path
-        self.conn = None
-        self._connect_database()
-        
-    def _connect_database(self):
-        """Establish database connection"""
+        self._pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=pool_size)
+        self._catalog_cache: Optional[Tuple[float, Dict[str, sqlite3.Row]]] = None
+        self._catalog_lock = threading.Lock()
+        # Workflow log rows buffered per pooled connection until its transaction commits
+        self._pending_log_rows: Dict[sqlite3.Connection, List[tuple]] = {}
+        self._connect_database(pool_size)
+        
+    def _connect_database(self, pool_size: int):
+        """Open the connection pool"""
         try:
-            self.conn = sqlite3.connect(self.db_path)
-            self.conn.row_factory = sqlite3.Row
-            logger.info(f"Connected to sales automation database: {self.db_path}")
+            for _ in range(pool_size):
+                self._pool.put_nowait(self._open_connection())
+            logger.info(f"Connected to sales automation database: {self.db_path} ({pool_size} connections)")
         except Exception as e:
             logger.error(f"Database connection failed: {e}")
+            self.close_connection()
             raise
     
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open one pooled connection; autocommit mode, so transactions are
+        explicit in _transaction and plain reads never hold a lock"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                               cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        # WAL with NORMAL sync: commits append to the log instead of fsyncing the
+        # database, and readers on other pooled connections run alongside the writer
+        conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+        """)
+        return conn
+    
     def close_connection(self):
-        """Close database connection"""
-        if self.conn:
-            self.conn.close()
+        """Close all pooled database connections"""
+        closed = 0
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+            closed += 1
+        if closed:
             logger.info("Database connection closed")
     
+    @contextmanager
+    def _connection(self, conn: Optional[sqlite3.Connection] = None):
+        """Yield the connection to run on: the caller's (inside its transaction)
+        or one borrowed from the pool and returned afterwards"""
+        if conn is not None:
+            yield conn
+            return
+        pooled = self._pool.get()
+        try:
+            yield pooled
+        finally:
+            self._pool.put(pooled)
+    
+    @contextmanager
+    def _transaction(self, conn: Optional[sqlite3.Connection] = None):
+        """Yield the connection to write on; commits (or rolls back on error) only
+        when it is borrowed from the pool, otherwise the caller's transaction owns it"""
+        if conn is not None:
+            yield conn
+            return
+        with self._connection() as pooled:
+            log_rows = self._pending_log_rows[pooled] = []
+            # IMMEDIATE takes the write lock up front, so concurrent writers wait
+            # out the connect timeout instead of failing to upgrade a read transaction
+            pooled.execute("BEGIN IMMEDIATE")
+            try:
+                yield pooled
+                if log_rows:
+                    pooled.executemany(_INSERT_WORKFLOW_LOG_SQL, log_rows)
+                # A failed COMMIT rolls back too, so the connection never
+                # returns to the pool inside a transaction
+                pooled.execute("COMMIT")
+            except BaseException:
+                if pooled.in_transaction:
+                    pooled.execute("ROLLBACK")
+                raise
+            finally:
+                del self._pending_log_rows[pooled]
+    
     # ================================
     # DISCOVERY CALL PROCESSING
     # ================================
@@ -148,51 +680,19 @@ class SalesProcessAutomationEngine:
             call_id: ID of the created discovery call record
         """
         try:
-            cursor = self.conn.cursor()
-            
             # Calculate qualification scores
             qualification_scores = self._calculate_qualification_scores(call_data)
             
-            # Insert discovery call record
-            cursor.execute("""
-                INSERT INTO discovery_calls (
-                    prospect_id, sales_rep, company_name, company_size, industry, annual_revenue,
-                    primary_contact_name, primary_contact_email, primary_contact_title,
-                    decision_maker_name, decision_maker_title,
-                    current_challenges, manual_processes, time_waste_hours_weekly, 
-                    estimated_cost_inefficiency, current_tools_systems, team_size_affected,
-                    primary_objectives, success_metrics, automation_priorities,
-                    integration_requirements, compliance_requirements, security_requirements,
-                    budget_range, timeline_urgency, decision_timeline, roi_expectations,
-                    pain_level_score, budget_authority_score, timeline_urgency_score,
-                    technical_fit_score, overall_qualification_score,
-                    call_duration_minutes, next_steps, call_notes,
-                    qualified_status
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                prospect_id, call_data.sales_rep, call_data.company_name, call_data.company_size,
-                call_data.industry, call_data.annual_revenue,
-                call_data.primary_contact_name, call_data.primary_contact_email, call_data.primary_contact_title,
-                call_data.decision_maker_name, call_data.decision_maker_title,
-                call_data.current_challenges, call_data.manual_processes, call_data.time_waste_hours_weekly,
-                call_data.estimated_cost_inefficiency, call_data.current_tools_systems, call_data.team_size_affected,
-                call_data.primary_objectives, call_data.success_metrics, call_data.automation_priorities,
-                call_data.integration_requirements, call_data.compliance_requirements, call_data.security_requirements,
-                call_data.budget_range, call_data.timeline_urgency, call_data.decision_timeline, call_data.roi_expectations,
-                qualification_scores['pain_level'], qualification_scores['budget_authority'], qualification_scores['timeline_urgency'],
-                qualification_scores['technical_fit'], qualification_scores['overall_score'],
-                call_data.call_duration_minutes, call_data.next_steps, call_data.call_notes,
-                qualification_scores['status'].value
-            ))
-            
-            call_id = cursor.lastrowid
-            self.conn.commit()
-            
-            # Log automation trigger
-            self._log_workflow_automation(
-                "discovery_to_sow", call_id, None, "discovery_call_processed",
-                f"Discovery call processed with qualification score: {qualification_scores['overall_score']}"
-            )
+            # Insert discovery call record and its log entry in one transaction
+            with self._transaction() as db:
+                call_id = self._insert_discovery_call(db.cursor(), prospect_id, call_data, qualification_scores)
+                
+                # Log automation trigger
+                self._log_workflow_automation(
+                    "discovery_to_sow", call_id, None, "discovery_call_processed",
+                    f"Discovery call processed with qualification score: {qualification_scores['overall_score']}",
+                    conn=db
+                )
             
             # Trigger automatic SOW generation if qualified
             if qualification_scores['status'] == QualificationStatus.QUALIFIED:
@@ -208,45 +708,61 @@ class SalesProcessAutomationEngine:
             logger.error(f"Error processing discovery call: {e}")
             raise
     
-    def _calculate_qualification_scores(self, call_data: DiscoveryCallData) -> Dict[str, Any]:
-        """Calculate qualification scores based on discovery call data"""
+    def _insert_discovery_call(self, cursor: sqlite3.Cursor, prospect_id: int,
+                               call_data: DiscoveryCallData, scores: Dict[str, Any]) -> int:
+        """Insert one scored discovery call; the caller owns the transaction"""
+        cursor.execute(_INSERT_DISCOVERY_CALL_SQL, (
+            prospect_id, *_discovery_call_values(call_data), *_discovery_call_scores(scores)
+        ))
+        return cursor.lastrowid
+    
+    def process_discovery_calls_bulk(self, batch: List[Tuple[int, DiscoveryCallData]]) -> List[int]:
+        """
+        Process many discovery calls in a single transaction
         
-        # Pain Level Score (0-10)
-        pain_score = 0
-        if call_data.time_waste_hours_weekly > 20:
-            pain_score += 4
-        elif call_data.time_waste_hours_weekly > 10:
-            pain_score += 2
-        elif call_data.time_waste_hours_weekly > 5:
-            pain_score += 1
+        Args:
+            batch: (prospect_id, call_data) pairs
             
-        if call_data.estimated_cost_inefficiency > 100000:
-            pain_score += 4
-        elif call_data.estimated_cost_inefficiency > 50000:
-            pain_score += 3
-        elif call_data.estimated_cost_inefficiency > 25000:
-            pain_score += 2
-        elif call_data.estimated_cost_inefficiency > 10000:
-            pain_score += 1
+        Returns:
+            call_ids: IDs of the created discovery call records, in batch order
+        """
+        scored = [(prospect_id, call_data, self._calculate_qualification_scores(call_data))
+                  for prospect_id, call_data in batch]
+        
+        call_ids = []
+        with self._transaction() as db:
+            cursor = db.cursor()
+            for prospect_id, call_data, scores in scored:
+                call_id = self._insert_discovery_call(cursor, prospect_id, call_data, scores)
+                self._log_workflow_automation(
+                    "discovery_to_sow", call_id, None, "discovery_call_processed",
+                    f"Discovery call processed with qualification score: {scores['overall_score']}",
+                    conn=db
+                )
+                call_ids.append(call_id)
             
-        if call_data.team_size_affected > 10:
-            pain_score += 2
-        elif call_data.team_size_affected > 5:
-            pain_score += 1
+            # SOWs for the qualified calls commit with the calls themselves
+            for call_id, (_, _, scores) in zip(call_ids, scored):
+                if (scores['status'] == QualificationStatus.QUALIFIED
+                        and self.generate_sow_from_discovery(call_id, conn=db) is None):
+                    raise RuntimeError(f"SOW generation failed for discovery call {call_id}")
+        
+        logger.info(f"Processed {len(call_ids)} discovery calls in bulk")
+        return call_ids
+    
+    def _calculate_qualification_scores(self, call_data: DiscoveryCallData) -> Dict[str, Any]:
+        """Calculate qualification scores based on discovery call data"""
         
+        # Pain Level Score (0-10)
+        pain_score = (
+            _PAIN_HOURS_POINTS[bisect_left(_PAIN_HOURS_THRESHOLDS, call_data.time_waste_hours_weekly)]
+            + _PAIN_COST_POINTS[bisect_left(_PAIN_COST_THRESHOLDS, call_data.estimated_cost_inefficiency)]
+            + _PAIN_TEAM_POINTS[bisect_left(_PAIN_TEAM_THRESHOLDS, call_data.team_size_affected)]
+        )
         pain_score = min(pain_score, 10)
         
         # Budget Authority Score (0-10)
-        budget_score = 0
-        budget_mapping = {
-            "under_25k": 2,
-            "25k_50k": 4,
-            "50k_100k": 6,
-            "100k_250k": 8,
-            "250k_plus": 10,
-            "not_disclosed": 3
-        }
-        budget_score = budget_mapping.get(call_data.budget_range, 3)
+        budget_score = _BUDGET_SCORES.get(call_data.budget_range, 3)
         
         if call_data.decision_maker_name:
             budget_score += 2
@@ -254,33 +770,14 @@ class SalesProcessAutomationEngine:
         budget_score = min(budget_score, 10)
         
         # Timeline Urgency Score (0-10)
-        timeline_score = 0
-        urgency_mapping = {
-            "immediate": 10,
-            "1_month": 8,
-            "3_months": 6,
-            "6_months": 4,
-            "12_months": 2
-        }
-        timeline_score = urgency_mapping.get(call_data.timeline_urgency, 3)
-        
-        # Technical Fit Score (0-10)
-        technical_score = 5  # Base score
+        timeline_score = _URGENCY_SCORES.get(call_data.timeline_urgency, 3)
         
+        # Technical Fit Score (0-10), from a base score of 5
         # Adjust based on company size (better fit for mid-market)
-        size_scoring = {
-            "11-50": 2,
-            "51-200": 3,
-            "201-500": 2,
-            "501-1000": 1,
-            "1000+": 1,
-            "1-10": 1
-        }
-        technical_score += size_scoring.get(call_data.company_size, 1)
+        technical_score = 5 + _COMPANY_SIZE_SCORES.get(call_data.company_size, 1)
         
         # Industry fit scoring
-        high_fit_industries = ["technology", "professional services", "healthcare", "finance", "real estate"]
-        if call_data.industry.lower() in high_fit_industries:
+        if call_data.industry.lower() in _HIGH_FIT_INDUSTRIES:
             technical_score += 2
         
         technical_score = min(technical_score, 10)
@@ -289,14 +786,7 @@ class SalesProcessAutomationEngine:
         overall_score = int((pain_score * 0.3 + budget_score * 0.3 + timeline_score * 0.2 + technical_score * 0.2) * 10)
         
         # Determine qualification status
-        if overall_score >= 70:
-            status = QualificationStatus.QUALIFIED
-        elif overall_score >= 50:
-            status = QualificationStatus.NURTURE
-        elif overall_score >= 30:
-            status = QualificationStatus.PENDING_REVIEW
-        else:
-            status = QualificationStatus.DISQUALIFIED
+        status = _QUALIFICATION_STATUSES[bisect_right(_QUALIFICATION_THRESHOLDS, overall_score)]
         
         return {
             "pain_level": pain_score,
@@ -307,93 +797,139 @@ class SalesProcessAutomationEngine:
             "status": status
         }
     
+    def score_qualifications_bulk(self, calls: "pd.DataFrame") -> "pd.DataFrame":
+        """
+        Vectorized _calculate_qualification_scores for backfills and reporting
+        
+        Args:
+            calls: Discovery calls with the DiscoveryCallData scoring columns
+                   (e.g. pd.read_sql("SELECT * FROM discovery_calls", conn))
+            
+        Returns:
+            DataFrame aligned to calls.index with pain_level, budget_authority,
+            timeline_urgency, technical_fit, overall_score and status (the
+            QualificationStatus value) columns
+        """
+        import numpy as np
+        import pandas as pd
+        
+        # np.digitize(right=True) matches bisect_left on the strict '>' tiers
+        pain = (
+            np.take(_PAIN_HOURS_POINTS, np.digitize(calls['time_waste_hours_weekly'].to_numpy(), _PAIN_HOURS_THRESHOLDS, right=True))
+            + np.take(_PAIN_COST_POINTS, np.digitize(calls['estimated_cost_inefficiency'].to_numpy(), _PAIN_COST_THRESHOLDS, right=True))
+            + np.take(_PAIN_TEAM_POINTS, np.digitize(calls['team_size_affected'].to_numpy(), _PAIN_TEAM_THRESHOLDS, right=True))
+        )
+        pain = np.minimum(pain, 10)
+        
+        has_decision_maker = calls['decision_maker_name'].fillna('').astype(str).str.len().to_numpy() > 0
+        budget = calls['budget_range'].map(_BUDGET_SCORES).fillna(3).to_numpy(dtype=np.int64)
+        budget = np.minimum(budget + 2 * has_decision_maker, 10)
+        
+        timeline = calls['timeline_urgency'].map(_URGENCY_SCORES).fillna(3).to_numpy(dtype=np.int64)
+        
+        technical = 5 + calls['company_size'].map(_COMPANY_SIZE_SCORES).fillna(1).to_numpy(dtype=np.int64)
+        technical = technical + 2 * calls['industry'].str.lower().isin(_HIGH_FIT_INDUSTRIES).to_numpy()
+        technical = np.minimum(technical, 10)
+        
+        # Same float64 operations in the same order as the scalar path, then truncated
+        overall = ((pain * 0.3 + budget * 0.3 + timeline * 0.2 + technical * 0.2) * 10).astype(np.int64)
+        
+        # np.digitize(right=False) matches bisect_right on the '>=' status tiers
+        status_values = np.array([status.value for status in _QUALIFICATION_STATUSES], dtype=object)
+        status = status_values[np.digitize(overall, _QUALIFICATION_THRESHOLDS)]
+        
+        return pd.DataFrame({
+            "pain_level": pain,
+            "budget_authority": budget,
+            "timeline_urgency": timeline,
+            "technical_fit": technical,
+            "overall_score": overall,
+            "status": status
+        }, index=calls.index)
+    
     # ================================
     # SOW GENERATION
     # ================================
     
-    def generate_sow_from_discovery(self, call_id: int) -> Optional[int]:
+    def generate_sow_from_discovery(self, call_id: int,
+                                    conn: Optional[sqlite3.Connection] = None) -> Optional[int]:
         """
         Generate Statement of Work based on discovery call data
         
         Args:
             call_id: ID of the discovery call
+            conn: Caller's connection with an open transaction; the caller commits,
+                  and errors are raised for it to roll back instead of returning None
             
         Returns:
             sow_id: ID of the generated SOW, or None if generation failed
         """
         try:
-            cursor = self.conn.cursor()
-            
-            # Get discovery call data
-            cursor.execute("SELECT * FROM discovery_calls WHERE call_id = ?", (call_id,))
-            call_data = cursor.fetchone()
-            
-            if not call_data:
-                logger.error(f"Discovery call {call_id} not found")
-                return None
-            
-            # Analyze requirements and recommend services
-            recommended_services = self._analyze_requirements_and_recommend_services(call_data)
-            
-            # Calculate pricing
-            pricing = self._calculate_project_pricing(call_data, recommended_services)
-            
-            # Generate SOW content
-            sow_content = self._generate_sow_content(call_data, recommended_services, pricing)
-            
-            # Create payment schedule
-            payment_schedule = self._create_payment_schedule(pricing.total_project_cost, len(recommended_services))
-            
-            # Insert SOW record
-            cursor.execute("""
-                INSERT INTO generated_sows (
-                    discovery_call_id, project_title, project_description,
-                    business_objectives, success_criteria, included_services,
-                    deliverables, timeline_weeks, project_phases,
-                    base_services_cost, additional_services_cost, complexity_adjustments,
-                    discounts_applied, total_project_cost, payment_schedule,
-                    exclusions, assumptions, change_request_process, acceptance_criteria,
-                    expires_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                call_id, sow_content['title'], sow_content['description'],
-                sow_content['objectives'], sow_content['success_criteria'], json.dumps(recommended_services),
-                sow_content['deliverables'], pricing.estimated_hours // 40 + 1, json.dumps(sow_content['phases']),
-                pricing.base_services_cost, pricing.additional_services_cost, pricing.complexity_adjustments,
-                pricing.discounts_applied, pricing.total_project_cost, json.dumps(payment_schedule),
-                sow_content['exclusions'], sow_content['assumptions'], 
-                sow_content['change_request_process'], sow_content['acceptance_criteria'],
-                datetime.now() + timedelta(days=30)  # Expires in 30 days
-            ))
-            
-            sow_id = cursor.lastrowid
-            self.conn.commit()
-            
-            # Log workflow automation
-            self._log_workflow_automation(
-                "discovery_to_sow", call_id, sow_id, "sow_generated",
-                f"SOW automatically generated with total cost: ${pricing.total_project_cost:,.2f}"
-            )
+            # Read the call and insert the SOW with its log entry in one transaction
+            with self._transaction(conn) as db:
+                cursor = db.cursor()
+                
+                # Get discovery call data
+                cursor.execute(_SELECT_SOW_SOURCE_SQL, (call_id,))
+                call_data = cursor.fetchone()
+                
+                if not call_data:
+                    logger.error(f"Discovery call {call_id} not found")
+                    return None
+                
+                # Analyze requirements and recommend services
+                recommended_services = self._analyze_requirements_and_recommend_services(call_data, conn=db)
+                
+                # Calculate pricing
+                pricing = self._calculate_project_pricing(call_data, recommended_services)
+                
+                # Generate SOW content
+                sow_content = self._generate_sow_content(call_data, recommended_services, pricing)
+                
+                # Create payment schedule
+                payment_schedule = self._create_payment_schedule(pricing.total_project_cost, len(recommended_services))
+                
+                # Insert SOW record
+                cursor.execute(_INSERT_SOW_SQL, (
+                    call_id, sow_content['title'], sow_content['description'],
+                    sow_content['objectives'], sow_content['success_criteria'], _json_column(recommended_services),
+                    sow_content['deliverables'], sow_content['timeline_weeks'], _json_column(sow_content['phases']),
+                    pricing.base_services_cost, pricing.additional_services_cost, pricing.complexity_adjustments,
+                    pricing.discounts_applied, pricing.total_project_cost, _json_column(payment_schedule),
+                    sow_content['exclusions'], sow_content['assumptions'],
+                    sow_content['change_request_process'], sow_content['acceptance_criteria']
+                ))
+                
+                sow_id = cursor.lastrowid
+                
+                # Log workflow automation
+                self._log_workflow_automation(
+                    "discovery_to_sow", call_id, sow_id, "sow_generated",
+                    f"SOW automatically generated with total cost: ${pricing.total_project_cost:,.2f}",
+                    conn=db
+                )
             
             logger.info(f"SOW {sow_id} generated for discovery call {call_id}")
             return sow_id
             
         except Exception as e:
             logger.error(f"Error generating SOW for call {call_id}: {e}")
+            if conn is not None:
+                # The caller's transaction is left for the caller to roll back
+                raise
             return None
     
-    def _analyze_requirements_and_recommend_services(self, call_data: sqlite3.Row) -> List[ServiceConfiguration]:
+    def _analyze_requirements_and_recommend_services(self, call_data: sqlite3.Row,
+                                                     conn: Optional[sqlite3.Connection] = None) -> List[ServiceConfiguration]:
         """Analyze discovery call data and recommend appropriate services"""
         
-        # Get available services from catalog
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM service_catalog WHERE is_active = 1")
-        services = cursor.fetchall()
+        # Get available services from catalog, indexed by category
+        services_by_category = self._load_service_catalog(conn)
         
         recommended = []
         
         # Automation Development (Core Service)
-        automation_service = next((s for s in services if 'automation_development' in s['service_category']), None)
+        automation_service = services_by_category.get(ServiceCategory.AUTOMATION_DEVELOPMENT)
         if automation_service:
             # Determine complexity based on requirements
             complexity_factors = 1.0
@@ -419,7 +955,7 @@ class SalesProcessAutomationEngine:
         
         # Process Optimization (if significant manual processes)
         if call_data['time_waste_hours_weekly'] > 10:
-            process_service = next((s for s in services if 'process_optimization' in s['service_category']), None)
+            process_service = services_by_category.get(ServiceCategory.PROCESS_OPTIMIZATION)
             if process_service:
                 recommended.append(ServiceConfiguration(
                     service_id=process_service['service_id'],
@@ -431,12 +967,12 @@ class SalesProcessAutomationEngine:
                 ))
         
         # Integration Setup (if multiple integrations needed)
-        if call_data['integration_requirements'] and 'integration' in call_data['integration_requirements'].lower():
-            integration_service = next((s for s in services if 'integration_setup' in s['service_category']), None)
+        integration_requirements = (call_data['integration_requirements'] or '').lower()
+        if 'integration' in integration_requirements:
+            integration_service = services_by_category.get(ServiceCategory.INTEGRATION_SETUP)
             if integration_service:
-                # Estimate number of integrations
-                integration_count = call_data['integration_requirements'].lower().count('api') + \
-                                  call_data['integration_requirements'].lower().count('system') + 1
+                # Estimate number of integrations: one plus each "api"/"system" mention
+                integration_count = len(_INTEGRATION_MENTION_RE.findall(integration_requirements)) + 1
                 
                 recommended.append(ServiceConfiguration(
                     service_id=integration_service['service_id'],
@@ -448,9 +984,8 @@ class SalesProcessAutomationEngine:
                 ))
         
         # Ongoing Management (for larger companies)
-        company_size_scores = {'201-500': 1, '501-1000': 1, '1000+': 1}
-        if call_data['company_size'] in company_size_scores:
-            ongoing_service = next((s for s in services if 'ongoing_management' in s['service_category']), None)
+        if call_data['company_size'] in _ONGOING_MANAGEMENT_SIZES:
+            ongoing_service = services_by_category.get(ServiceCategory.ONGOING_MANAGEMENT)
             if ongoing_service:
                 recommended.append(ServiceConfiguration(
                     service_id=ongoing_service['service_id'],
@@ -463,7 +998,7 @@ class SalesProcessAutomationEngine:
         
         # Training (if large team affected)
         if call_data['team_size_affected'] > 10:
-            training_service = next((s for s in services if 'training' in s['service_category']), None)
+            training_service = services_by_category.get(ServiceCategory.TRAINING)
             if training_service:
                 recommended.append(ServiceConfiguration(
                     service_id=training_service['service_id'],
@@ -476,6 +1011,30 @@ class SalesProcessAutomationEngine:
         
         return recommended
     
+    def _load_service_catalog(self, conn: Optional[sqlite3.Connection] = None) -> Dict[str, sqlite3.Row]:
+        """Active services indexed by category (first active service of each category
+        wins, matching catalog order); cached for _SERVICE_CATALOG_TTL_SECONDS"""
+        
+        with self._catalog_lock:
+            cached = self._catalog_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
+        with self._connection(conn) as db:
+            catalog = db.execute(_SELECT_ACTIVE_SERVICES_SQL).fetchall()
+        services_by_category = {}
+        for service in catalog:
+            services_by_category.setdefault(service['service_category'], service)
+        
+        with self._catalog_lock:
+            self._catalog_cache = (time.monotonic() + _SERVICE_CATALOG_TTL_SECONDS, services_by_category)
+        return services_by_category
+    
+    def invalidate_catalog_cache(self):
+        """Drop the cached service catalog; call after editing service_catalog"""
+        with self._catalog_lock:
+            self._catalog_cache = None
+    
     def _calculate_project_pricing(self, call_data: sqlite3.Row, services: List[ServiceConfiguration]) -> PricingBreakdown:
         """Calculate detailed project pricing with all adjustments"""
         
@@ -486,34 +1045,13 @@ class SalesProcessAutomationEngine:
         complexity_adjustment = 0.0
         
         # Company size adjustments
-        size_adjustments = {
-            '1-10': -0.15,      # 15% discount for small companies
-            '11-50': -0.05,     # 5% discount
-            '51-200': 0.0,      # Standard pricing
-            '201-500': 0.1,     # 10% premium
-            '501-1000': 0.15,   # 15% premium
-            '1000+': 0.2        # 20% premium
-        }
-        complexity_adjustment += base_cost * size_adjustments.get(call_data['company_size'], 0.0)
+        complexity_adjustment += base_cost * _SIZE_ADJUSTMENTS.get(call_data['company_size'], 0.0)
         
         # Industry adjustments
-        industry_premiums = {
-            'healthcare': 0.15,
-            'finance': 0.20,
-            'government': 0.25
-        }
-        if call_data['industry'].lower() in industry_premiums:
-            complexity_adjustment += base_cost * industry_premiums[call_data['industry'].lower()]
+        complexity_adjustment += base_cost * _INDUSTRY_PREMIUMS.get(call_data['industry'].lower(), 0.0)
         
         # Timeline urgency adjustments
-        urgency_premiums = {
-            'immediate': 0.25,
-            '1_month': 0.15,
-            '3_months': 0.05,
-            '6_months': 0.0,
-            '12_months': -0.05
-        }
-        complexity_adjustment += base_cost * urgency_premiums.get(call_data['timeline_urgency'], 0.0)
+        complexity_adjustment += base_cost * _URGENCY_PREMIUMS.get(call_data['timeline_urgency'], 0.0)
         
         # Apply discounts
         discounts = 0.0
@@ -575,474 +1113,374 @@ class SalesProcessAutomationEngine:
         """
         
         # Success Criteria
-        content['success_criteria'] = call_data['success_metrics'] or """
-        - 80% reduction in manual processing time
-        - 95% accuracy in automated processes
-        - ROI achievement within 12 months
-        - Full team adoption and utilization
-        - Seamless integration with existing systems
-        """
+        content['success_criteria'] = call_data['success_metrics'] or _SOW_DEFAULT_SUCCESS_CRITERIA
         
-        # Deliverables
-        deliverables_list = []
-        for service in services:
-            if 'automation_development' in service.service_category:
-                deliverables_list.extend([
-                    "Custom automation workflows and business logic",
-                    "User interface for process management",
-                    "System integration and API connections",
-                    "Data migration and cleanup processes"
-                ])
-            elif 'process_optimization' in service.service_category:
-                deliverables_list.extend([
-                    "Process analysis and optimization recommendations",
-                    "Workflow redesign and efficiency improvements",
-                    "Standard operating procedures documentation"
-                ])
-            elif 'integration_setup' in service.service_category:
-                deliverables_list.extend([
-                    "API integrations with existing systems",
-                    "Data synchronization and mapping",
-                    "Integration testing and validation"
-                ])
-            elif 'training' in service.service_category:
-                deliverables_list.extend([
-                    "User training materials and documentation",
-                    "Live training sessions for team members",
-                    "Ongoing support and knowledge transfer"
-                ])
-        
-        content['deliverables'] = "\\n".join(f"• {item}" for item in deliverables_list)
-        
-        # Project Phases
-        phases = [
-            {
-                "phase": 1,
-                "name": "Discovery & Planning",
-                "duration_weeks": 1,
-                "description": "Detailed requirements analysis, system architecture design, and project planning"
-            },
-            {
-                "phase": 2,
-                "name": "Development & Integration", 
-                "duration_weeks": pricing.estimated_hours // 40,
-                "description": "Core automation development, system integrations, and testing"
-            },
-            {
-                "phase": 3,
-                "name": "Testing & Training",
-                "duration_weeks": 1,
-                "description": "User acceptance testing, team training, and knowledge transfer"
-            },
-            {
-                "phase": 4,
-                "name": "Launch & Support",
-                "duration_weeks": 1,
-                "description": "Production deployment, go-live support, and transition to operations"
-            }
+        # Deliverables (identical for every SOW with the same service bundle)
+        content['deliverables'] = _sow_deliverables(frozenset(service.service_category for service in services))
+        
+        # Project Phases (development length follows the estimated hours)
+        content['timeline_weeks'] = _weeks_from_hours(pricing.estimated_hours)
+        content['phases'] = [
+            _SOW_PHASES[0],
+            {**_SOW_PHASES[1], "duration_weeks": content['timeline_weeks']},
+            *_SOW_PHASES[2:]
         ]
-        content['phases'] = phases
         
         # Exclusions
-        content['exclusions'] = """
-        • Third-party software licensing costs (client responsibility)
-        • Hardware or infrastructure costs beyond software development
-        • Ongoing maintenance beyond 30-day warranty period
-        • Changes to original scope without formal change request approval
-        • Training for more than 10 users (additional training available separately)
-        """
+        content['exclusions'] = _SOW_EXCLUSIONS
         
         # Assumptions
-        content['assumptions'] = f"""
-        • Client will provide timely access to required systems and stakeholders
-        • Existing systems have available APIs or integration capabilities
-        • Client technical team will be available for collaboration and testing
-        • Project timeline assumes standard business hours (M-F, 9-5 {call_data['company_name']} timezone)
-        • No major system changes will occur during project implementation
-        """
+        content['assumptions'] = _SOW_ASSUMPTIONS_TEMPLATE.format(company_name=call_data['company_name'])
         
         # Change Request Process
-        content['change_request_process'] = """
-        All changes to project scope must be documented in writing and approved by both parties. 
-        Change requests will be evaluated for impact on timeline, cost, and deliverables. 
-        Additional work will be billed at standard hourly rates with prior approval.
-        """
+        content['change_request_process'] = _SOW_CHANGE_REQUEST_PROCESS
         
         # Acceptance Criteria
-        content['acceptance_criteria'] = """
-        Each deliverable will be considered complete upon successful demonstration of functionality, 
-        passing of all defined tests, and written acceptance by client project stakeholder. 
-        Final project acceptance requires successful completion of all deliverables and 
-        30-day production stability period.
-        """
+        content['acceptance_criteria'] = _SOW_ACCEPTANCE_CRITERIA
         
         return content
     
     def _create_payment_schedule(self, total_cost: float, num_services: int) -> List[Dict[str, Any]]:
         """Create milestone-based payment schedule"""
         
-        # Standard payment schedule based on project phases
-        if total_cost < 50000:
-            # Small projects: 50% upfront, 50% on completion
-            schedule = [
-                {
-                    "milestone": "Project Start",
-                    "percentage": 50.0,
-                    "amount": total_cost * 0.5,
-                    "description": "Initial payment to begin project development"
-                },
-                {
-                    "milestone": "Project Completion",
-                    "percentage": 50.0,
-                    "amount": total_cost * 0.5,
-                    "description": "Final payment upon successful project delivery"
-                }
-            ]
-        elif total_cost < 150000:
-            # Medium projects: 30% / 40% / 30%
-            schedule = [
-                {
-                    "milestone": "Project Start",
-                    "percentage": 30.0,
-                    "amount": total_cost * 0.3,
-                    "description": "Initial payment to begin project development"
-                },
-                {
-                    "milestone": "Development Milestone",
-                    "percentage": 40.0,
-                    "amount": total_cost * 0.4,
-                    "description": "Payment upon completion of core development"
-                },
-                {
-                    "milestone": "Project Completion",
-                    "percentage": 30.0,
-                    "amount": total_cost * 0.3,
-                    "description": "Final payment upon successful project delivery"
-                }
-            ]
-        else:
-            # Large projects: 25% / 25% / 25% / 25%
-            schedule = [
-                {
-                    "milestone": "Project Start",
-                    "percentage": 25.0,
-                    "amount": total_cost * 0.25,
-                    "description": "Initial payment to begin project development"
-                },
-                {
-                    "milestone": "Development Phase 1",
-                    "percentage": 25.0,
-                    "amount": total_cost * 0.25,
-                    "description": "Payment upon completion of phase 1 development"
-                },
-                {
-                    "milestone": "Development Phase 2",
-                    "percentage": 25.0,
-                    "amount": total_cost * 0.25,
-                    "description": "Payment upon completion of phase 2 development"
-                },
-                {
-                    "milestone": "Project Completion",
-                    "percentage": 25.0,
-                    "amount": total_cost * 0.25,
-                    "description": "Final payment upon successful project delivery"
-                }
-            ]
-        
-        return schedule
+        # Standard payment schedule based on project phases and size
+        milestones = _PAYMENT_SCHEDULES[bisect_right(_PAYMENT_SCHEDULE_THRESHOLDS, total_cost)]
+        return [
+            {
+                "milestone": milestone,
+                "percentage": percentage,
+                "amount": total_cost * fraction,
+                "description": description
+            }
+            for milestone, percentage, fraction, description in milestones
+        ]
     
     # ================================
     # CONTRACT GENERATION
     # ================================
     
-    def generate_contract_from_sow(self, sow_id: int, template_id: int = 1) -> Optional[int]:
+    def generate_contract_from_sow(self, sow_id: int, template_id: int = 1,
+                                   conn: Optional[sqlite3.Connection] = None,
+                                   sow_row: Optional[sqlite3.Row] = None) -> Optional[int]:
         """
         Generate contract from approved SOW
         
         Args:
             sow_id: ID of the approved SOW
             template_id: ID of the contract template to use
+            conn: Caller's connection with an open transaction; the caller commits,
+                  and errors are raised for it to roll back instead of returning None
+            sow_row: SOW joined with its discovery call, if the caller already has it
+                     (e.g. from UPDATE ... RETURNING); skips re-fetching the SOW
             
         Returns:
             contract_id: ID of the generated contract, or None if generation failed
         """
         try:
-            cursor = self.conn.cursor()
+            with self._transaction(conn) as db:
+                cursor = db.cursor()
+                
+                # Get SOW data
+                if sow_row is not None:
+                    sow_data = sow_row
+                else:
+                    cursor.execute(_SELECT_CONTRACT_SOURCE_SQL, (sow_id,))
+                    sow_data = cursor.fetchone()
+                
+                if not sow_data or sow_data['sow_status'] != 'approved':
+                    logger.error(f"SOW {sow_id} not found or not approved")
+                    return None
+                
+                # Get contract template
+                cursor.execute(_SELECT_CONTRACT_TEMPLATE_SQL, (template_id,))
+                template = cursor.fetchone()
+                
+                if not template:
+                    logger.error(f"Contract template {template_id} not found")
+                    return None
+                
+                # Generate and insert contract record
+                contract_id, contract_number = self._insert_contract(cursor, sow_data, template, template_id)
+                
+                # Log workflow automation
+                self._log_workflow_automation(
+                    "sow_to_contract", sow_id, contract_id, "contract_generated",
+                    f"Contract {contract_number} generated from SOW {sow_id}", conn=db
+                )
             
-            # Get SOW data
-            cursor.execute("""
-                SELECT s.*, d.* FROM generated_sows s 
-                JOIN discovery_calls d ON s.discovery_call_id = d.call_id 
-                WHERE s.sow_id = ?
-            """, (sow_id,))
-            sow_data = cursor.fetchone()
+            logger.info(f"Contract {contract_id} generated for SOW {sow_id}")
+            return contract_id
             
-            if not sow_data or sow_data['sow_status'] != 'approved':
-                logger.error(f"SOW {sow_id} not found or not approved")
-                return None
+        except Exception as e:
+            logger.error(f"Error generating contract for SOW {sow_id}: {e}")
+            if conn is not None:
+                # The caller's transaction is left for the caller to roll back
+                raise
+            return None
+    
+    def generate_contracts_bulk(self, sow_ids: List[int], template_id: int = 1) -> List[Optional[int]]:
+        """
+        Generate contracts for many approved SOWs in a single transaction
+        
+        Args:
+            sow_ids: IDs of the approved SOWs
+            template_id: ID of the contract template to use for all of them
             
-            # Get contract template
-            cursor.execute("SELECT * FROM contract_templates WHERE template_id = ?", (template_id,))
-            template = cursor.fetchone()
+        Returns:
+            contract_ids: IDs of the generated contracts in sow_ids order, with
+                          None for SOWs that were not found or not approved
+        """
+        contract_ids = []
+        with self._transaction() as db:
+            cursor = db.cursor()
             
+            cursor.execute(_SELECT_CONTRACT_TEMPLATE_SQL, (template_id,))
+            template = cursor.fetchone()
             if not template:
                 logger.error(f"Contract template {template_id} not found")
-                return None
-            
-            # Generate contract content
-            contract_content = self._generate_contract_content(sow_data, template)
-            contract_number = f"ENT-{datetime.now().strftime('%Y%m')}-{sow_id:04d}"
-            
-            # Calculate contract dates
-            project_start = datetime.now().date() + timedelta(days=14)  # 2 weeks from now
-            project_duration_weeks = sow_data['timeline_weeks']
-            project_end = project_start + timedelta(weeks=project_duration_weeks)
-            contract_expiration = datetime.now().date() + timedelta(days=365)  # 1 year contract
-            
-            # Insert contract record
-            cursor.execute("""
-                INSERT INTO generated_contracts (
-                    sow_id, template_id, contract_number, contract_title,
-                    client_legal_name, client_address, client_signatory_name,
-                    client_signatory_title, client_signatory_email,
-                    provider_signatory_name, provider_signatory_title,
-                    total_contract_value, payment_schedule,
-                    project_start_date, project_end_date, contract_effective_date, contract_expiration_date,
-                    contract_content, contract_hash
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                sow_id, template_id, contract_number, sow_data['project_title'],
-                sow_data['company_name'], f"{sow_data['company_name']} Address", # TODO: Get actual address
-                sow_data['primary_contact_name'], sow_data['primary_contact_title'], sow_data['primary_contact_email'],
-                "Jordan Martinez", "CEO",  # Default Entelech signatory
-                sow_data['total_project_cost'], sow_data['payment_schedule'],
-                project_start, project_end, datetime.now().date(), contract_expiration,
-                contract_content, hashlib.sha256(contract_content.encode()).hexdigest()
-            ))
-            
-            contract_id = cursor.lastrowid
-            self.conn.commit()
+                return [None] * len(sow_ids)
             
-            # Log workflow automation
-            self._log_workflow_automation(
-                "sow_to_contract", sow_id, contract_id, "contract_generated",
-                f"Contract {contract_number} generated from SOW {sow_id}"
-            )
+            # All SOWs in one query; the id list binds as a single JSON array
+            cursor.execute(_SELECT_CONTRACT_SOURCES_SQL, (_json_column(sow_ids),))
+            sows_by_id = {row['sow_id']: row for row in cursor.fetchall()}
             
-            logger.info(f"Contract {contract_id} generated for SOW {sow_id}")
-            return contract_id
-            
-        except Exception as e:
-            logger.error(f"Error generating contract for SOW {sow_id}: {e}")
-            return None
+            for sow_id in sow_ids:
+                sow_data = sows_by_id.get(sow_id)
+                if not sow_data or sow_data['sow_status'] != 'approved':
+                    logger.error(f"SOW {sow_id} not found or not approved")
+                    contract_ids.append(None)
+                    continue
+                
+                contract_id, contract_number = self._insert_contract(cursor, sow_data, template, template_id)
+                self._log_workflow_automation(
+                    "sow_to_contract", sow_id, contract_id, "contract_generated",
+                    f"Contract {contract_number} generated from SOW {sow_id}", conn=db
+                )
+                contract_ids.append(contract_id)
+        
+        logger.info(f"Generated {sum(contract_id is not None for contract_id in contract_ids)} contracts in bulk")
+        return contract_ids
+    
+    def _insert_contract(self, cursor: sqlite3.Cursor, sow_data: sqlite3.Row, template: sqlite3.Row,
+                         template_id: int) -> Tuple[int, str]:
+        """Generate and insert one contract for an approved SOW; the caller owns the
+        transaction. Returns the contract ID and number"""
+        
+        # Generate contract content
+        sow_id = sow_data['sow_id']
+        now = datetime.now()
+        today = now.date()
+        contract_number = f"ENT-{now.strftime('%Y%m')}-{sow_id:04d}"
+        contract_content = self._generate_contract_content(sow_data, template, contract_number, now)
+        
+        # Calculate contract dates
+        project_start = today + timedelta(days=14)  # 2 weeks from now
+        project_duration_weeks = sow_data['timeline_weeks']
+        project_end = project_start + timedelta(weeks=project_duration_weeks)
+        contract_expiration = today + timedelta(days=365)  # 1 year contract
+        
+        cursor.execute(_INSERT_CONTRACT_SQL, (
+            sow_id, template_id, contract_number, sow_data['project_title'],
+            sow_data['company_name'], f"{sow_data['company_name']} Address", # TODO: Get actual address
+            sow_data['primary_contact_name'], sow_data['primary_contact_title'], sow_data['primary_contact_email'],
+            "Jordan Martinez", "CEO",  # Default Entelech signatory
+            sow_data['total_project_cost'], sow_data['payment_schedule'],
+            project_start, project_end, today, contract_expiration,
+            contract_content, hashlib.sha256(contract_content.encode()).hexdigest()
+        ))
+        return cursor.lastrowid, contract_number
     
-    def _generate_contract_content(self, sow_data: sqlite3.Row, template: sqlite3.Row) -> str:
+    def _generate_contract_content(self, sow_data: sqlite3.Row, template: sqlite3.Row,
+                                   contract_number: str, now: datetime) -> str:
         """Generate complete contract content from template and SOW data"""
         
-        content = template['template_content']
-        
-        # Contract-specific variables
+        # Contract-specific variables, keyed by the exact template token and
+        # stringified up front
         variables = {
-            "{{CONTRACT_NUMBER}}": f"ENT-{datetime.now().strftime('%Y%m')}-{sow_data['sow_id']:04d}",
-            "{{CONTRACT_DATE}}": datetime.now().strftime('%B %d, %Y'),
-            "{{CLIENT_COMPANY_NAME}}": sow_data['company_name'],
-            "{{CLIENT_CONTACT_NAME}}": sow_data['primary_contact_name'],
-            "{{CLIENT_CONTACT_TITLE}}": sow_data['primary_contact_title'],
-            "{{CLIENT_EMAIL}}": sow_data['primary_contact_email'],
-            "{{PROJECT_TITLE}}": sow_data['project_title'],
-            "{{PROJECT_DESCRIPTION}}": sow_data['project_description'],
+            "{{CONTRACT_NUMBER}}": contract_number,
+            "{{CONTRACT_DATE}}": now.strftime('%B %d, %Y'),
+            "{{CLIENT_COMPANY_NAME}}": str(sow_data['company_name']),
+            "{{CLIENT_CONTACT_NAME}}": str(sow_data['primary_contact_name']),
+            "{{CLIENT_CONTACT_TITLE}}": str(sow_data['primary_contact_title']),
+            "{{CLIENT_EMAIL}}": str(sow_data['primary_contact_email']),
+            "{{PROJECT_TITLE}}": str(sow_data['project_title']),
+            "{{PROJECT_DESCRIPTION}}": str(sow_data['project_description']),
             "{{TOTAL_CONTRACT_VALUE}}": f"${sow_data['total_project_cost']:,.2f}",
             "{{PROJECT_TIMELINE}}": f"{sow_data['timeline_weeks']} weeks",
-            "{{DELIVERABLES}}": sow_data['deliverables'],
-            "{{PAYMENT_TERMS}}": sow_data.get('payment_terms', '30 days'),
-            "{{GOVERNING_LAW}}": template['governing_law'],
+            "{{DELIVERABLES}}": str(sow_data['deliverables']),
+            "{{PAYMENT_TERMS}}": sow_data['payment_terms'] or '30 days',
+            "{{GOVERNING_LAW}}": str(template['governing_law']),
             "{{LIABILITY_CAP}}": f"{template['liability_cap_percentage']}% of contract value",
             "{{WARRANTY_PERIOD}}": f"{template['warranty_period_months']} months",
             "{{PROVIDER_SIGNATORY}}": "Jordan Martinez, CEO"
         }
         
-        # Replace all variables
-        for variable, value in variables.items():
-            content = content.replace(variable, str(value))
-        
-        return content
+        # Fill every variable in one pass over the pre-split template
+        tokens = _contract_template_tokens(template['template_content'])
+        return "".join([variables.get(token, token) for token in tokens])
     
     # ================================
     # PAYMENT PROCESSING SETUP
     # ================================
     
-    def setup_payment_processing(self, contract_id: int, payment_provider: str = "stripe") -> Optional[int]:
+    def setup_payment_processing(self, contract_id: int, payment_provider: str = "stripe",
+                                 conn: Optional[sqlite3.Connection] = None) -> Optional[int]:
         """
         Setup automated payment processing for signed contract
         
         Args:
             contract_id: ID of the signed contract
             payment_provider: Payment processor to use
+            conn: Caller's connection with an open transaction; the caller commits,
+                  and errors are raised for it to roll back instead of returning None
             
         Returns:
             config_id: ID of the payment configuration, or None if setup failed
         """
         try:
-            cursor = self.conn.cursor()
-            
-            # Get contract data
-            cursor.execute("""
-                SELECT c.*, s.payment_schedule FROM generated_contracts c
-                JOIN generated_sows s ON c.sow_id = s.sow_id
-                WHERE c.contract_id = ? AND c.contract_status = 'fully_executed'
-            """, (contract_id,))
-            contract_data = cursor.fetchone()
-            
-            if not contract_data:
-                logger.error(f"Contract {contract_id} not found or not fully executed")
-                return None
-            
-            # Parse payment schedule
-            payment_schedule = json.loads(contract_data['payment_schedule'])
-            
-            # Create payment configuration
-            cursor.execute("""
-                INSERT INTO payment_configurations (
-                    contract_id, payment_provider, payment_type, total_amount,
-                    currency, payment_schedule, auto_invoice_enabled, late_fee_enabled
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                contract_id, payment_provider, "milestone_based", contract_data['total_contract_value'],
-                "USD", json.dumps(payment_schedule), True, True
-            ))
-            
-            config_id = cursor.lastrowid
-            
-            # Generate initial invoices for immediate milestones
-            self._generate_milestone_invoices(config_id, payment_schedule)
-            
-            self.conn.commit()
-            
-            # Log workflow automation
-            self._log_workflow_automation(
-                "contract_to_payment", contract_id, config_id, "payment_setup",
-                f"Payment processing configured for contract {contract_data['contract_number']}"
-            )
+            with self._transaction(conn) as db:
+                cursor = db.cursor()
+                
+                # Get contract data
+                cursor.execute(_SELECT_PAYMENT_SOURCE_SQL, (contract_id,))
+                contract_data = cursor.fetchone()
+                
+                if not contract_data:
+                    logger.error(f"Contract {contract_id} not found or not fully executed")
+                    return None
+                
+                # Parse payment schedule for invoicing; the stored JSON text is copied as-is
+                payment_schedule = json.loads(contract_data['payment_schedule'])
+                
+                # Create payment configuration
+                cursor.execute(_INSERT_PAYMENT_CONFIGURATION_SQL, (
+                    contract_id, payment_provider, "milestone_based", contract_data['total_contract_value'],
+                    "USD", contract_data['payment_schedule'], True, True
+                ))
+                
+                config_id = cursor.lastrowid
+                
+                # Generate initial invoices for immediate milestones
+                self._generate_milestone_invoices(config_id, payment_schedule, conn=db)
+                
+                # Log workflow automation
+                self._log_workflow_automation(
+                    "contract_to_payment", contract_id, config_id, "payment_setup",
+                    f"Payment processing configured for contract {contract_data['contract_number']}", conn=db
+                )
             
             logger.info(f"Payment processing configured for contract {contract_id}")
             return config_id
             
         except Exception as e:
             logger.error(f"Error setting up payment processing for contract {contract_id}: {e}")
+            if conn is not None:
+                # The caller's transaction is left for the caller to roll back
+                raise
             return None
     
-    def _generate_milestone_invoices(self, config_id: int, payment_schedule: List[Dict[str, Any]]):
+    def _generate_milestone_invoices(self, config_id: int, payment_schedule: List[Dict[str, Any]],
+                                     conn: Optional[sqlite3.Connection] = None):
         """Generate invoices for immediate payment milestones"""
         
-        cursor = self.conn.cursor()
+        # Generate invoices for "Project Start" milestones immediately
+        immediate = [milestone for milestone in payment_schedule if milestone['milestone'] == "Project Start"]
+        if not immediate:
+            return
         
-        for milestone in payment_schedule:
-            # Generate invoice for "Project Start" milestone immediately
-            if milestone['milestone'] == "Project Start":
-                invoice_number = f"INV-{datetime.now().strftime('%Y%m%d')}-{config_id:04d}"
-                due_date = datetime.now().date() + timedelta(days=7)  # Due in 7 days
-                
-                cursor.execute("""
-                    INSERT INTO payment_transactions (
-                        config_id, transaction_type, amount, invoice_number,
-                        invoice_due_date, milestone_description, payment_method,
-                        transaction_status
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    config_id, "invoice", milestone['amount'], invoice_number,
-                    due_date, milestone['description'], "credit_card", "pending"
-                ))
-                
-                logger.info(f"Invoice {invoice_number} generated for milestone: {milestone['milestone']}")
+        today = date.today()
+        invoice_number = f"INV-{today.strftime('%Y%m%d')}-{config_id:04d}"
+        due_date = today + timedelta(days=7)  # Due in 7 days
+        
+        with self._transaction(conn) as db:
+            db.executemany(_INSERT_INVOICE_SQL, [
+                (config_id, "invoice", milestone['amount'], invoice_number,
+                 due_date, milestone['description'], "credit_card", "pending")
+                for milestone in immediate
+            ])
+        
+        for milestone in immediate:
+            logger.info(f"Invoice {invoice_number} generated for milestone: {milestone['milestone']}")
     
     # ================================
     # PROJECT KICKOFF AUTOMATION
     # ================================
     
-    def trigger_project_kickoff(self, contract_id: int) -> Optional[int]:
+    def trigger_project_kickoff(self, contract_id: int,
+                                conn: Optional[sqlite3.Connection] = None) -> Optional[int]:
         """
         Trigger automated project kickoff after first payment received
         
         Args:
             contract_id: ID of the contract with received payment
+            conn: Caller's connection with an open transaction; the caller commits,
+                  and errors are raised for it to roll back instead of returning None
             
         Returns:
             kickoff_id: ID of the project kickoff record, or None if failed
         """
         try:
-            cursor = self.conn.cursor()
-            
-            # Get contract and payment data
-            cursor.execute("""
-                SELECT c.*, s.project_title, s.included_services 
-                FROM generated_contracts c
-                JOIN generated_sows s ON c.sow_id = s.sow_id
-                WHERE c.contract_id = ?
-            """, (contract_id,))
-            contract_data = cursor.fetchone()
-            
-            if not contract_data:
-                logger.error(f"Contract {contract_id} not found")
-                return None
-            
-            # Verify first payment received
-            cursor.execute("""
-                SELECT COUNT(*) as payment_count FROM payment_configurations pc
-                JOIN payment_transactions pt ON pc.config_id = pt.config_id
-                WHERE pc.contract_id = ? AND pt.transaction_status = 'completed'
-                AND pt.transaction_type = 'payment'
-            """, (contract_id,))
-            
-            payment_check = cursor.fetchone()
-            if payment_check['payment_count'] == 0:
-                logger.warning(f"No payments received for contract {contract_id} - kickoff not triggered")
-                return None
-            
-            # Determine appropriate kickoff template
-            services = json.loads(contract_data['included_services'])
-            template_id = self._select_kickoff_template(services)
-            
-            # Generate unique project code
-            project_code = f"ENT{datetime.now().strftime('%y%m')}{contract_id:03d}"
-            
-            # Create project kickoff record
-            cursor.execute("""
-                INSERT INTO project_kickoffs (
-                    contract_id, template_id, project_code, project_name,
-                    project_manager, kickoff_scheduled_date
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                contract_id, template_id, project_code, contract_data['project_title'],
-                "Alex Thompson",  # Default PM - should be configurable
-                datetime.now() + timedelta(days=3)  # Schedule kickoff in 3 days
-            ))
-            
-            kickoff_id = cursor.lastrowid
-            
-            # Initialize kickoff checklist and tasks
-            self._initialize_project_kickoff_tasks(kickoff_id, template_id)
-            
-            self.conn.commit()
-            
-            # Log workflow automation
-            self._log_workflow_automation(
-                "payment_to_kickoff", contract_id, kickoff_id, "kickoff_triggered",
-                f"Project kickoff initiated for project {project_code}"
-            )
+            with self._transaction(conn) as db:
+                cursor = db.cursor()
+                
+                # Get contract and payment data
+                cursor.execute(_SELECT_KICKOFF_SOURCE_SQL, (contract_id,))
+                contract_data = cursor.fetchone()
+                
+                if not contract_data:
+                    logger.error(f"Contract {contract_id} not found")
+                    return None
+                
+                # Verify first payment received
+                cursor.execute(_SELECT_COMPLETED_PAYMENT_SQL, (contract_id,))
+                
+                if cursor.fetchone() is None:
+                    logger.warning(f"No payments received for contract {contract_id} - kickoff not triggered")
+                    return None
+                
+                # Determine appropriate kickoff template
+                services = json.loads(contract_data['included_services'])
+                template_id = self._select_kickoff_template(
+                    tuple(service.get('service_category', '') for service in services)
+                )
+                
+                # Generate unique project code
+                project_code = f"ENT{datetime.now().strftime('%y%m')}{contract_id:03d}"
+                
+                # Create project kickoff record
+                cursor.execute(_INSERT_PROJECT_KICKOFF_SQL, (
+                    contract_id, template_id, project_code, contract_data['project_title'],
+                    "Alex Thompson",  # Default PM - should be configurable
+                    datetime.now() + timedelta(days=3)  # Schedule kickoff in 3 days
+                ))
+                
+                kickoff_id = cursor.lastrowid
+                
+                # Initialize kickoff checklist and tasks
+                self._initialize_project_kickoff_tasks(kickoff_id, template_id, conn=db)
+                
+                # Log workflow automation
+                self._log_workflow_automation(
+                    "payment_to_kickoff", contract_id, kickoff_id, "kickoff_triggered",
+                    f"Project kickoff initiated for project {project_code}", conn=db
+                )
             
             logger.info(f"Project kickoff {kickoff_id} triggered for contract {contract_id}")
             return kickoff_id
             
         except Exception as e:
             logger.error(f"Error triggering project kickoff for contract {contract_id}: {e}")
+            if conn is not None:
+                # The caller's transaction is left for the caller to roll back
+                raise
             return None
     
-    def _select_kickoff_template(self, services: List[Dict[str, Any]]) -> int:
-        """Select appropriate kickoff template based on included services"""
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _select_kickoff_template(categories: Tuple[str, ...]) -> int:
+        """Select appropriate kickoff template based on included service categories"""
         
         # Analyze service categories to determine best template
-        categories = [service.get('service_category', '') for service in services]
-        
         if 'automation_development' in categories and len(categories) > 2:
             return 1  # Complex automation template
         elif 'automation_development' in categories:
@@ -1050,54 +1488,46 @@ class SalesProcessAutomationEngine:
         else:
             return 3  # Basic services template
     
-    def _initialize_project_kickoff_tasks(self, kickoff_id: int, template_id: int):
+    def _initialize_project_kickoff_tasks(self, kickoff_id: int, template_id: int,
+                                          conn: Optional[sqlite3.Connection] = None):
         """Initialize project kickoff tasks based on template"""
         
-        cursor = self.conn.cursor()
-        
-        # Get template data
-        cursor.execute("SELECT * FROM kickoff_templates WHERE template_id = ?", (template_id,))
-        template = cursor.fetchone()
+        # Initialize kickoff deliverables from template in one statement
+        with self._transaction(conn) as db:
+            updated = db.execute(_UPDATE_KICKOFF_DELIVERABLES_SQL, (template_id, kickoff_id)).fetchone()
         
-        if template:
-            # Initialize kickoff deliverables from template
-            deliverables = json.loads(template['initial_deliverables'])
-            
-            cursor.execute("""
-                UPDATE project_kickoffs 
-                SET kickoff_deliverables = ?
-                WHERE kickoff_id = ?
-            """, (json.dumps(deliverables), kickoff_id))
-            
-            logger.info(f"Initialized {len(deliverables)} kickoff tasks for project {kickoff_id}")
+        if updated:
+            logger.info(f"Initialized {updated['deliverable_count']} kickoff tasks for project {kickoff_id}")
     
     # ================================
     # WORKFLOW AUTOMATION HELPERS
     # ================================
     
     def _log_workflow_automation(self, process_type: str, source_id: int, target_id: Optional[int],
-                                action: str, description: str, user: str = "system"):
-        """Log workflow automation events for tracking and debugging"""
+                                action: str, description: str, user: str = "system",
+                                conn: Optional[sqlite3.Connection] = None):
+        """Log workflow automation events for tracking and debugging; inside one of
+        the engine's own transactions the row is buffered and written at commit"""
         
-        cursor = self.conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO workflow_automation_log (
-                process_type, source_record_id, target_record_id, automation_trigger,
-                automation_action, automation_status, automation_result, triggered_by_user
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        row = (
             process_type, source_id, target_id, "automatic_trigger", action,
-            "completed", json.dumps({"description": description, "timestamp": datetime.now().isoformat()}),
+            "completed", _json_column({"description": description, "timestamp": datetime.now()}),
             user
-        ))
+        )
         
-        self.conn.commit()
+        with self._transaction(conn) as db:
+            log_rows = self._pending_log_rows.get(db)
+            if log_rows is not None:
+                log_rows.append(row)
+            else:
+                # Caller-owned transaction: write now so the caller's commit covers it
+                db.execute(_INSERT_WORKFLOW_LOG_SQL, row)
     
-    def get_workflow_status(self, process_type: str = None, status: str = None) -> List[Dict[str, Any]]:
-        """Get workflow automation status and history"""
-        
-        cursor = self.conn.cursor()
+    def get_workflow_status(self, process_type: str = None, status: str = None,
+                            limit: int = 100, offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """Iterate workflow automation status and history, newest first; the page
+        is fetched and the pooled connection released before the first row is
+        yielded, so a slow or abandoned consumer never holds the pool"""
         
         query = "SELECT * FROM workflow_automation_log WHERE 1=1"
         params = []
@@ -1110,113 +1540,82 @@ class SalesProcessAutomationEngine:
             query += " AND automation_status = ?"
             params.append(status)
         
-        query += " ORDER BY created_at DESC LIMIT 100"
+        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
         
-        cursor.execute(query, params)
-        results = cursor.fetchall()
+        with self._connection() as db:
+            rows = db.execute(query, params).fetchall()
         
-        return [dict(row) for row in results]
+        for row in rows:
+            yield dict(row)
+    
+    def get_workflow_status_list(self, process_type: str = None, status: str = None,
+                                 limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        """Get workflow automation status and history as a list"""
+        return list(self.get_workflow_status(process_type, status, limit, offset))
     
     # ================================
     # SALES PROCESS ANALYTICS
     # ================================
     
-    def get_sales_process_analytics(self, date_range: Tuple[date, date]) -> Dict[str, Any]:
+    def get_sales_process_analytics(self, date_range: Tuple[date, date],
+                                    conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
         """Get comprehensive analytics on the sales process performance"""
         
-        cursor = self.conn.cursor()
-        
-        analytics = {
-            "discovery_calls": {},
-            "sow_generation": {},
-            "contract_execution": {},
-            "payment_processing": {},
-            "project_kickoffs": {},
-            "automation_efficiency": {}
-        }
-        
-        # Discovery call analytics
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_calls,
-                AVG(overall_qualification_score) as avg_qualification_score,
-                SUM(CASE WHEN qualified_status = 'qualified' THEN 1 ELSE 0 END) as qualified_count,
-                AVG(call_duration_minutes) as avg_call_duration,
-                AVG(time_waste_hours_weekly) as avg_time_waste,
-                AVG(estimated_cost_inefficiency) as avg_cost_inefficiency
-            FROM discovery_calls 
-            WHERE call_date BETWEEN ? AND ?
-        """, (date_range[0], date_range[1]))
-        
-        discovery_stats = cursor.fetchone()
-        analytics["discovery_calls"] = dict(discovery_stats) if discovery_stats else {}
-        
-        # SOW generation analytics
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_sows,
-                SUM(CASE WHEN sow_status = 'approved' THEN 1 ELSE 0 END) as approved_count,
-                AVG(total_project_cost) as avg_project_value,
-                SUM(total_project_cost) as total_pipeline_value,
-                AVG(timeline_weeks) as avg_timeline_weeks
-            FROM generated_sows s
-            JOIN discovery_calls d ON s.discovery_call_id = d.call_id
-            WHERE d.call_date BETWEEN ? AND ?
-        """, (date_range[0], date_range[1]))
-        
-        sow_stats = cursor.fetchone()
-        analytics["sow_generation"] = dict(sow_stats) if sow_stats else {}
-        
-        # Contract execution analytics
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_contracts,
-                SUM(CASE WHEN contract_status = 'fully_executed' THEN 1 ELSE 0 END) as executed_count,
-                SUM(CASE WHEN contract_status = 'fully_executed' THEN total_contract_value ELSE 0 END) as closed_revenue,
-                AVG(CASE WHEN fully_executed_at IS NOT NULL 
-                    THEN DATEDIFF(fully_executed_at, sent_for_signature_at) ELSE NULL END) as avg_signing_days
-            FROM generated_contracts c
-            JOIN generated_sows s ON c.sow_id = s.sow_id
-            JOIN discovery_calls d ON s.discovery_call_id = d.call_id
-            WHERE d.call_date BETWEEN ? AND ?
-        """, (date_range[0], date_range[1]))
-        
-        contract_stats = cursor.fetchone()
-        analytics["contract_execution"] = dict(contract_stats) if contract_stats else {}
-        
-        # Calculate conversion rates
-        total_calls = analytics["discovery_calls"].get("total_calls", 0)
-        qualified_calls = analytics["discovery_calls"].get("qualified_count", 0)
-        approved_sows = analytics["sow_generation"].get("approved_count", 0)
-        executed_contracts = analytics["contract_execution"].get("executed_count", 0)
-        
-        analytics["conversion_rates"] = {
-            "call_to_qualified": (qualified_calls / total_calls * 100) if total_calls > 0 else 0,
-            "qualified_to_sow": (approved_sows / qualified_calls * 100) if qualified_calls > 0 else 0,
-            "sow_to_contract": (executed_contracts / approved_sows * 100) if approved_sows > 0 else 0,
-            "overall_conversion": (executed_contracts / total_calls * 100) if total_calls > 0 else 0
-        }
-        
-        # Automation efficiency
-        cursor.execute("""
-            SELECT 
-                process_type,
-                COUNT(*) as total_automations,
-                SUM(CASE WHEN automation_status = 'completed' THEN 1 ELSE 0 END) as successful_automations,
-                AVG(processing_duration_seconds) as avg_processing_time
-            FROM workflow_automation_log 
-            WHERE processing_start_time BETWEEN ? AND ?
-            GROUP BY process_type
-        """, (date_range[0], date_range[1]))
-        
-        automation_stats = cursor.fetchall()
-        analytics["automation_efficiency"] = {
-            row["process_type"]: {
-                "total": row["total_automations"],
-                "successful": row["successful_automations"],
-                "success_rate": (row["successful_automations"] / row["total_automations"] * 100) if row["total_automations"] > 0 else 0,
-                "avg_processing_time": row["avg_processing_time"]
-            } for row in automation_stats
-        }
+        with self._connection(conn) as db:
+            cursor = db.cursor()
+            
+            analytics = {
+                "discovery_calls": {},
+                "sow_generation": {},
+                "contract_execution": {},
+                "payment_processing": {},
+                "project_kickoffs": {},
+                "automation_efficiency": {}
+            }
+            
+            # Discovery, SOW and contract stats in one statement over a single
+            # call_date range scan
+            cursor.execute(_SALES_FUNNEL_ANALYTICS_SQL, (date_range[0], date_range[1]))
+            funnel_stats = cursor.fetchone()
+            analytics["discovery_calls"] = {key: funnel_stats[key] for key in _DISCOVERY_ANALYTICS_COLUMNS}
+            analytics["sow_generation"] = {key: funnel_stats[key] for key in _SOW_ANALYTICS_COLUMNS}
+            analytics["contract_execution"] = {key: funnel_stats[key] for key in _CONTRACT_ANALYTICS_COLUMNS}
+            
+            # Calculate conversion rates
+            total_calls = funnel_stats["total_calls"]
+            qualified_calls = funnel_stats["qualified_count"]
+            approved_sows = funnel_stats["approved_count"]
+            executed_contracts = funnel_stats["executed_count"]
+            
+            analytics["conversion_rates"] = {
+                "call_to_qualified": _percentage(qualified_calls, total_calls),
+                "qualified_to_sow": _percentage(approved_sows, qualified_calls),
+                "sow_to_contract": _percentage(executed_contracts, approved_sows),
+                "overall_conversion": _percentage(executed_contracts, total_calls)
+            }
+            
+            # Automation efficiency
+            cursor.execute("""
+                SELECT 
+                    process_type,
+                    COUNT(*) as total_automations,
+                    SUM(CASE WHEN automation_status = 'completed' THEN 1 ELSE 0 END) as successful_automations,
+                    100.0 * SUM(CASE WHEN automation_status = 'completed' THEN 1 ELSE 0 END) / COUNT(*) as success_rate,
+                    AVG(processing_duration_seconds) as avg_processing_time
+                FROM workflow_automation_log 
+                WHERE processing_start_time BETWEEN ? AND ?
+                GROUP BY process_type
+            """, (date_range[0], date_range[1]))
+            
+            automation_stats = cursor.fetchall()
+            analytics["automation_efficiency"] = {
+                row["process_type"]: {
+                    "total": row["total_automations"],
+                    "successful": row["successful_automations"],
+                    "success_rate": row["success_rate"],
+                    "avg_processing_time": row["avg_processing_time"]
+                } for row in automation_stats
+            }
         
         return analytics
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""
+Shared fixtures: a temporary SQLite database built from the project schema,
+an engine bound to it, and a dashboard test client pointed at it
+"""
+
+import os
+import re
+import sqlite3
+import sys
+import threading
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+sys.path.insert(0, os.path.join(ROOT, 'dashboard'))
+
+SCHEMA_PATH = os.path.join(ROOT, 'database', 'sales_process_schema.sql')
+
+# Discovery call that scores as qualified, as submitted to /api/discovery/submit
+QUALIFIED_CALL = {
+    "company_name": "Acme",
+    "company_size": "201-500",
+    "industry": "Finance",
+    "annual_revenue": "5m_25m",
+    "primary_contact_name": "Pat Lee",
+    "primary_contact_email": "pat@acme.example",
+    "primary_contact_title": "COO",
+    "decision_maker_name": "Dana Cole",
+    "current_challenges": "Manual invoicing",
+    "manual_processes": "Invoice entry",
+    "time_waste_hours_weekly": 25,
+    "estimated_cost_inefficiency": 120000,
+    "team_size_affected": 15,
+    "primary_objectives": "Automate invoicing",
+    "integration_requirements": "CRM and ERP API integration",
+    "budget_range": "100k_250k",
+    "timeline_urgency": "immediate",
+    "sales_rep": "Sam",
+}
+
+def sqlite_schema() -> str:
+    """The project schema (MySQL dialect) rewritten for SQLite"""
+    with open(SCHEMA_PATH) as f:
+        schema = f.read()
+    schema = re.sub(r'CREATE DATABASE.*?;\s*USE .*?;', '', schema, flags=re.S)
+    schema = schema.replace('INT PRIMARY KEY AUTO_INCREMENT', 'INTEGER PRIMARY KEY AUTOINCREMENT')
+    schema = re.sub(r"ENUM\([^)]*\)", "TEXT", schema)
+    return schema.replace('ON UPDATE CURRENT_TIMESTAMP', '')
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Schema plus the reference rows the workflow reads: services, a contract
+    template and kickoff templates"""
+    path = str(tmp_path / 'sales_automation.db')
+    conn = sqlite3.connect(path)
+    conn.executescript(sqlite_schema())
+    conn.executemany("""
+        INSERT INTO service_catalog (service_name, service_category, service_description,
+                                     base_price, base_hours_required, standard_deliverables)
+        VALUES (?, ?, 'Test service', ?, ?, 'Deliverables')
+    """, [
+        ("Automation Development", "automation_development", 40000, 200),
+        ("Process Optimization", "process_optimization", 10000, 60),
+        ("Integration Setup", "integration_setup", 5000, 30),
+        ("Ongoing Management", "ongoing_management", 3000, 20),
+        ("Training", "training", 4000, 24),
+    ])
+    conn.execute("""
+        INSERT INTO contract_templates (template_name, template_type, template_content)
+        VALUES ('Standard', 'standard', 'Contract {{CONTRACT_NUMBER}} for {{CLIENT_COMPANY_NAME}}')
+    """)
+    conn.executemany("""
+        INSERT INTO kickoff_templates (template_name, service_category, kickoff_checklist,
+                                       required_client_information, initial_deliverables,
+                                       team_roles_required, estimated_team_size)
+        VALUES (?, 'automation_development', '[]', '[]', '["Kickoff deck"]', '[]', 3)
+    """, [("Kickoff 1",), ("Kickoff 2",), ("Kickoff 3",)])
+    conn.commit()
+    conn.close()
+    return path
+
+@pytest.fixture
+def engine(db_path):
+    from sales_automation_engine import SalesProcessAutomationEngine
+    engine = SalesProcessAutomationEngine(db_path, pool_size=2)
+    yield engine
+    engine.close_connection()
+
+@pytest.fixture
+def client(db_path, monkeypatch):
+    """Dashboard test client on a fresh database, with fresh per-thread
+    connections and engine"""
+    import sales_dashboard
+    monkeypatch.setattr(sales_dashboard, 'DB_PATH', db_path)
+    monkeypatch.setattr(sales_dashboard, '_tls', threading.local())
+    monkeypatch.setattr(sales_dashboard, '_engine_instance', None)
+    sales_dashboard.invalidate_overview_cache()
+    sales_dashboard.ensure_dashboard_indexes()
+
+    yield sales_dashboard.app.test_client()
+
+    if sales_dashboard._engine_instance is not None:
+        sales_dashboard._engine_instance.close_connection()
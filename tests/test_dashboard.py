@@ -0,0 +1,103 @@
+"""
+Dashboard API: discovery call pagination and the contract execution
+background task
+"""
+
+import time
+
+import pytest
+
+import sales_dashboard
+from conftest import QUALIFIED_CALL
+
+def submit_calls(client, count: int):
+    for i in range(count):
+        response = client.post('/api/discovery/submit', json=dict(QUALIFIED_CALL, company_name=f"Company {i}"))
+        assert response.status_code == 200
+
+def wait_for_task(client, task_id: str, timeout: float = 5.0) -> dict:
+    """Poll /api/tasks/<task_id> until the task finishes"""
+    deadline = time.monotonic() + timeout
+    while True:
+        task = client.get(f'/api/tasks/{task_id}').get_json()
+        if task['task_status'] in ('completed', 'failed') or time.monotonic() > deadline:
+            return task
+        time.sleep(0.05)
+
+def execute_new_contract(client):
+    """Submit a qualified call, approve its SOW and execute the contract"""
+    submit_calls(client, 1)
+    sow_id = client.get('/api/sows/list').get_json()['sows'][0]['sow_id']
+    contract_id = client.post(f'/api/sows/{sow_id}/approve').get_json()['contract_id']
+    return contract_id, client.post(f'/api/contracts/{contract_id}/execute')
+
+# ================================
+# DISCOVERY CALL PAGINATION
+# ================================
+
+def test_discovery_calls_keyset_pages_cover_every_call_once(client):
+    submit_calls(client, 5)
+
+    seen = []
+    response = client.get('/api/discovery/calls?limit=2').get_json()
+    seen += [call['call_id'] for call in response['calls']]
+    cursor = response['pagination']['next_cursor']
+    while cursor:
+        response = client.get('/api/discovery/calls', query_string=dict(cursor, limit=2)).get_json()
+        seen += [call['call_id'] for call in response['calls']]
+        cursor = response['pagination']['next_cursor']
+
+    # Newest first; calls inserted within the same second are ordered by call_id
+    assert seen == [5, 4, 3, 2, 1]
+
+@pytest.mark.parametrize("query, page, limit", [
+    ("limit=0", 1, 1),
+    ("limit=-5", 1, 1),
+    ("limit=1000", 1, 100),
+    ("page=0&limit=2", 1, 2),
+    ("page=-3", 1, 20),
+])
+def test_discovery_calls_clamps_page_and_limit(client, query, page, limit):
+    submit_calls(client, 3)
+
+    response = client.get(f'/api/discovery/calls?{query}')
+
+    assert response.status_code == 200
+    pagination = response.get_json()['pagination']
+    assert (pagination['page'], pagination['limit']) == (page, limit)
+
+def test_discovery_calls_empty_page_has_no_cursor(client):
+    response = client.get('/api/discovery/calls?limit=0')
+
+    assert response.status_code == 200
+    assert response.get_json()['pagination']['next_cursor'] is None
+
+# ================================
+# CONTRACT EXECUTION TASK
+# ================================
+
+def test_contract_execution_task_completes(client):
+    contract_id, response = execute_new_contract(client)
+
+    assert response.status_code == 202
+    task_id = response.get_json()['task_id']
+
+    task = wait_for_task(client, task_id)
+    assert task['task_status'] == 'completed'
+    assert task['source_record_id'] == contract_id
+    assert task['task_result']['payment_config_id'] is not None
+    # No payment has been received yet, so kickoff waits
+    assert task['task_result']['kickoff_id'] is None
+
+def test_contract_execution_task_records_failure(client, monkeypatch):
+    monkeypatch.setattr(sales_dashboard._engine(), 'setup_payment_processing', lambda *args, **kwargs: None)
+
+    contract_id, response = execute_new_contract(client)
+
+    assert response.status_code == 202
+    task = wait_for_task(client, response.get_json()['task_id'])
+    assert task['task_status'] == 'failed'
+    assert f"contract {contract_id}" in task['error_message']
+
+def test_unknown_task_is_not_found(client):
+    assert client.get('/api/tasks/missing').status_code == 404
@@ -0,0 +1,78 @@
+"""
+Engine transaction handling: rollback in _transaction and in bulk discovery
+"""
+
+import sqlite3
+
+import pytest
+
+from conftest import QUALIFIED_CALL
+from sales_automation_engine import DiscoveryCallData
+
+def count_rows(db_path: str, table: str) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+def test_transaction_rolls_back_on_error(engine, db_path):
+    with pytest.raises(RuntimeError):
+        with engine._transaction() as db:
+            db.execute("UPDATE service_catalog SET base_price = 0")
+            raise RuntimeError("boom")
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT MIN(base_price) FROM service_catalog").fetchone()[0] > 0
+    conn.close()
+
+    # Every pooled connection comes back outside a transaction
+    with engine._connection() as db:
+        assert not db.in_transaction
+
+def test_transaction_rolls_back_when_commit_fails(db_path):
+    from sales_automation_engine import SalesProcessAutomationEngine
+    engine = SalesProcessAutomationEngine(db_path, pool_size=1)
+    try:
+        # A deferred foreign key violation is only reported by COMMIT
+        with engine._connection() as db:
+            db.executescript("""
+                PRAGMA foreign_keys = ON;
+                CREATE TABLE fk_parent (id INTEGER PRIMARY KEY);
+                CREATE TABLE fk_child (
+                    parent_id INTEGER REFERENCES fk_parent(id) DEFERRABLE INITIALLY DEFERRED
+                );
+            """)
+
+        with pytest.raises(sqlite3.IntegrityError):
+            with engine._transaction() as db:
+                db.execute("INSERT INTO fk_child VALUES (1)")
+
+        with engine._connection() as db:
+            assert not db.in_transaction
+
+        # The pooled connection is usable for the next transaction
+        with engine._transaction() as db:
+            db.execute("INSERT INTO fk_parent VALUES (1)")
+        assert count_rows(db_path, "fk_child") == 0
+    finally:
+        engine.close_connection()
+
+def test_bulk_discovery_rolls_back_when_sow_generation_fails(engine, db_path, monkeypatch):
+    call_data = DiscoveryCallData(**QUALIFIED_CALL)
+
+    call_ids = engine.process_discovery_calls_bulk([(1, call_data), (1, call_data)])
+    assert len(call_ids) == 2
+    assert count_rows(db_path, "generated_sows") == 2
+
+    def fail_pricing(*args, **kwargs):
+        raise ValueError("pricing unavailable")
+    monkeypatch.setattr(engine, '_calculate_project_pricing', fail_pricing)
+
+    with pytest.raises(ValueError):
+        engine.process_discovery_calls_bulk([(1, call_data), (1, call_data)])
+
+    # Neither the calls, their SOWs nor the log rows of the failed batch remain
+    assert count_rows(db_path, "discovery_calls") == 2
+    assert count_rows(db_path, "generated_sows") == 2
+    assert count_rows(db_path, "workflow_automation_log") == 4